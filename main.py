@@ -8,6 +8,7 @@ and saves the results to a CSV file.
 
 import argparse
 import csv
+import dataclasses
 import logging
 import sys
 from datetime import datetime
@@ -148,24 +149,24 @@ def main() -> None:
         with launch_browser(headless=not args.no_headless) as (playwright, browser, context):
             page = new_page(context)
             
-            # Initialize scraper
-            scraper = MontrealRoleScraper(
+            # Initialize scraper; leaving the block persists queued cache
+            # writes and stops the writer before the cache is closed
+            with MontrealRoleScraper(
                 page=page,
                 cache=cache if not args.no_cache else None,
                 rate_limiter=rate_limiter,
                 login_email=MONTREAL_EMAIL,
                 login_password=MONTREAL_PASSWORD,
-            )
-            
-            # Process the CSV file
-            process_csv(
-                input_path=input_path,
-                output_path=output_path,
-                scraper=scraper,
-                chunk_size=args.chunk_size,
-                max_rows=args.max_rows,
-                start_row=args.start_row
-            )
+            ) as scraper:
+                # Process the CSV file
+                process_csv(
+                    input_path=input_path,
+                    output_path=output_path,
+                    scraper=scraper,
+                    chunk_size=args.chunk_size,
+                    max_rows=args.max_rows,
+                    start_row=args.start_row
+                )
             
             logger.info(f"Processing complete. Output saved to: {output_path}")
             
@@ -222,6 +223,7 @@ def process_csv(
         input_path,
         chunksize=chunk_size,
         dtype=str,
+        keep_default_na=False,  # Blank cells stay "" instead of NaN
         skiprows=range(1, start_row + 1)  # Skip header + start_row rows
     )
     
@@ -235,8 +237,15 @@ def process_csv(
     
     # Get the header from the first chunk
     first_chunk = True
+    columns: List[str] = []
     
     for chunk in chunks:
+        if not columns:
+            # Appended chunks are written without a header, so every chunk
+            # must use the same column order whichever rows succeeded
+            columns = list(dict.fromkeys(
+                [*chunk.columns, *REQUIRED_INPUT_COLUMNS, *OUTPUT_COLUMNS, "last_updated"]
+            ))
         chunk_processed = 0
         chunk_success = 0
         chunk_failure = 0
@@ -263,7 +272,7 @@ def process_csv(
             if query:
                 # Check for borough column if present
                 if query.neighborhood is None and BOROUGH_COLUMN in row_dict and row_dict[BOROUGH_COLUMN]:
-                    query.neighborhood = str(row_dict[BOROUGH_COLUMN]).strip()
+                    query = dataclasses.replace(query, neighborhood=str(row_dict[BOROUGH_COLUMN]).strip())
                     logger.debug(f"Using neighborhood from CSV: {query.neighborhood}")
                 
                 # Fetch property data
@@ -278,7 +287,8 @@ def process_csv(
             result_row = row_dict.copy()
             if status == "ok":
                 for key in OUTPUT_COLUMNS:
-                    result_row[key] = result.get(key, "")
+                    # Keep the input's address columns when the scraper doesn't report them
+                    result_row[key] = result.get(key, result_row.get(key, ""))
                 result_row["status"] = "success"
                 success_count += 1
                 chunk_success += 1
@@ -297,7 +307,7 @@ def process_csv(
         # Write the processed chunk to the output file
         try:
             # Convert to DataFrame for easier CSV writing
-            result_df = pd.DataFrame(updated_chunk)
+            result_df = pd.DataFrame(updated_chunk).reindex(columns=columns, fill_value="")
             
             # For the first chunk, write header, otherwise append
             mode = 'w' if first_chunk else 'a'
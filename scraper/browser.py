@@ -1,6 +1,7 @@
 import asyncio
 import contextlib
 import json
+import logging
 import os
 import random
 from pathlib import Path
@@ -10,6 +11,8 @@ from playwright.sync_api import Browser, BrowserContext, Page, Playwright, sync_
 
 from scraper.selectors import TIMEOUTS
 
+logger = logging.getLogger(__name__)
+
 
 USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -35,11 +38,8 @@ def _get_proxy_config() -> Optional[dict]:
     return {"server": https_proxy}
 
 
-@contextlib.contextmanager
-def launch_browser(headless: bool = True) -> Iterator[tuple[Playwright, Browser, BrowserContext]]:
-    playwright = sync_playwright().start()
-
-    # Get proxy configuration
+def browser_launch_options(headless: bool = True) -> dict:
+    """Build the Chromium launch options shared by runs and ``scraper.daemon``."""
     proxy_config = _get_proxy_config()
 
     # Build browser args
@@ -51,15 +51,34 @@ def launch_browser(headless: bool = True) -> Iterator[tuple[Playwright, Browser,
         '--disable-features=IsolateOrigins,site-per-process'
     ]
 
+    options = {"headless": headless, "args": browser_args}
     # Add proxy args for Chromium if proxy is configured
     if proxy_config:
         browser_args.append(f'--proxy-server={proxy_config["server"]}')
+        options["proxy"] = proxy_config  # Also pass to launch for proper auth handling
+    return options
 
-    browser = playwright.chromium.launch(
-        headless=headless,
-        args=browser_args,
-        proxy=proxy_config  # Also pass to launch for proper auth handling
-    )
+
+@contextlib.contextmanager
+def launch_browser(headless: bool = True) -> Iterator[tuple[Playwright, Browser, BrowserContext]]:
+    playwright = sync_playwright().start()
+
+    # Get proxy configuration
+    proxy_config = _get_proxy_config()
+
+    ws_endpoint = os.environ.get("MONTREAL_SCRAPER_WS")
+    if ws_endpoint:
+        # Reuse the long-lived browser started by scraper.daemon; it was
+        # launched with the daemon's own headless/args/proxy settings.
+        if not headless:
+            logger.warning(
+                "Ignoring headful mode: connected to %s, whose launch options are set by scraper.daemon "
+                "(start it with --no-headless instead)",
+                ws_endpoint,
+            )
+        browser = playwright.chromium.connect(ws_endpoint)
+    else:
+        browser = playwright.chromium.launch(**browser_launch_options(headless))
     user_agent = random.choice(USER_AGENTS)
 
     context = browser.new_context(
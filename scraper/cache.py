@@ -1,7 +1,8 @@
 import json
 import sqlite3
+import threading
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional, Tuple
 
 
 class Cache:
@@ -10,7 +11,10 @@ class Cache:
     def __init__(self, path: Path) -> None:
         self.path = path
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        self._conn = sqlite3.connect(self.path)
+        # The scraper persists entries from a background writer thread, so the
+        # connection is shared across threads and serialized with a lock.
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
         self._conn.execute(
             """
             CREATE TABLE IF NOT EXISTS cache (
@@ -29,22 +33,37 @@ class Cache:
         self.close()
 
     def get(self, key: str) -> Optional[Dict[str, Any]]:
-        cur = self._conn.execute("SELECT data FROM cache WHERE key = ?", (key,))
-        row = cur.fetchone()
+        with self._lock:
+            cur = self._conn.execute("SELECT data FROM cache WHERE key = ?", (key,))
+            row = cur.fetchone()
         if not row:
             return None
         return json.loads(row[0])
 
     def set(self, key: str, data: Dict[str, Any], timestamp: str) -> None:
         payload = json.dumps(data, ensure_ascii=False)
-        self._conn.execute(
-            "REPLACE INTO cache (key, data, updated_at) VALUES (?, ?, ?)",
-            (key, payload, timestamp),
-        )
-        self._conn.commit()
+        with self._lock:
+            self._conn.execute(
+                "REPLACE INTO cache (key, data, updated_at) VALUES (?, ?, ?)",
+                (key, payload, timestamp),
+            )
+            self._conn.commit()
+
+    def set_many(self, entries: Iterable[Tuple[str, Dict[str, Any], str]]) -> None:
+        """Persist several ``(key, data, timestamp)`` entries in one transaction."""
+        rows = [(key, json.dumps(data, ensure_ascii=False), timestamp) for key, data, timestamp in entries]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "REPLACE INTO cache (key, data, updated_at) VALUES (?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
 
     def close(self) -> None:
-        self._conn.close()
+        with self._lock:
+            self._conn.close()
 
 
 def normalize_key(*parts: str) -> str:
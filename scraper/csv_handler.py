@@ -1,9 +1,18 @@
 import csv
+import functools
 import os
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Generator
 from .schema import OUTPUT_COLUMNS, BOROUGH_COLUMN
 
+
+@functools.lru_cache(maxsize=8)
+def _output_header(header: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Return the input header extended with any missing output columns."""
+    present = set(header)
+    return header + tuple(col for col in OUTPUT_COLUMNS if col not in present)
+
+
 class CSVHandler:
     def __init__(self, input_path: str, output_path: Optional[str] = None):
         """
@@ -30,16 +39,14 @@ class CSVHandler:
     
     def write_output(self, header: List[str], rows: List[Dict[str, str]]) -> None:
         """Write processed rows to output CSV."""
-        # Ensure all output columns are in the header
-        output_header = header.copy()
-        for col in OUTPUT_COLUMNS:
-            if col not in output_header:
-                output_header.append(col)
-        
+        # The header is fixed for a run, so the merged column tuple is cached;
+        # rows are assembled as plain lists against it instead of letting
+        # DictWriter re-check every row's keys against the header.
+        columns = _output_header(tuple(header))
         with open(self.output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=output_header)
-            writer.writeheader()
-            writer.writerows(rows)
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            writer.writerows([row.get(col, "") for col in columns] for row in rows)
     
     def process_in_chunks(self, chunk_size: int = 20) -> Generator[Tuple[List[Dict[str, str]], int, int], None, None]:
         """Process input CSV in chunks to handle large files efficiently."""
@@ -0,0 +1,61 @@
+"""
+Long-lived Playwright browser server for the scraper.
+
+Launching Chromium costs hundreds of milliseconds per run. Start this daemon
+once: it launches a single Chromium with the same arguments, headless setting
+and proxy as ``launch_browser`` and keeps it alive. Point scraper runs at it
+through ``MONTREAL_SCRAPER_WS``; each run then only starts the Playwright
+driver and opens a fresh browser context over the WebSocket connection.
+
+Usage:
+    python -m scraper.daemon --host 127.0.0.1 --port 3131
+    export MONTREAL_SCRAPER_WS=ws://127.0.0.1:3131/
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from typing import List, Optional
+
+from scraper.browser import browser_launch_options
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Run a persistent Playwright browser server.")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface the server listens on")
+    parser.add_argument("--port", type=int, default=3131, help="Port the server listens on")
+    parser.add_argument(
+        "--no-headless",
+        action="store_true",
+        help="Run the shared browser with a visible window (default is headless)"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Launch one Chromium browser server and block until it exits."""
+    args = parse_args(argv)
+    options = browser_launch_options(headless=not args.no_headless)
+    options.update(host=args.host, port=args.port, wsPath="/")
+
+    # The Python bindings have no launch_server(); the bundled driver's
+    # launch-server command calls chromium.launchServer() with these options
+    # and prints the endpoint. The file may hold proxy credentials, and
+    # mkstemp creates it readable by the owner only.
+    fd, config_path = tempfile.mkstemp(suffix=".json")
+    try:
+        with os.fdopen(fd, "w") as handle:
+            json.dump(options, handle)
+        return subprocess.call(
+            [sys.executable, "-m", "playwright", "launch-server", "--browser", "chromium", "--config", config_path]
+        )
+    finally:
+        os.unlink(config_path)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
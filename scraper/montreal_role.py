@@ -1,12 +1,15 @@
 import datetime as dt
+import functools
 import json
 import logging
+import queue
 import re
+import threading
 import urllib.error
 import urllib.parse
 import urllib.request
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
 
@@ -27,8 +30,14 @@ logger = logging.getLogger(__name__)
 BASE_URL = "https://montreal.ca/role-evaluation-fonciere/adresse"
 STREET_API = "https://montreal.ca/info-recherche/api/evaluation-fonciere/gem/streets"
 
+NEXT_DATA_SCRIPT = "() => window.__NEXT_DATA__ || null"
 
-@dataclass
+_LOGIN_URL_RE = re.compile("|".join(re.escape(p) for p in URL_PATTERNS["login_patterns"]))
+# Queued after the last cache entry to tell the writer thread to exit.
+_STOP_WRITER = object()
+
+
+@dataclass(slots=True, frozen=True)
 class AddressQuery:
     civic_number: str
     street_name: str
@@ -61,6 +70,17 @@ class MontrealRoleScraper:
         self.login_email = login_email
         self.login_password = login_password
         self._auto_login_attempted = False
+        # Cache writes are persisted by a single background writer so that the
+        # SQLite commit never sits on the per-query critical path.
+        self._cache_q: "queue.Queue[Tuple[str, Dict[str, str], str]]" = queue.Queue(maxsize=1024)
+        self._cache_writer = threading.Thread(target=self._drain, name="cache-writer", daemon=True)
+        self._cache_writer.start()
+
+    def __enter__(self) -> "MontrealRoleScraper":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
 
     def sleep(self):
         if self.delay_after_actions:
@@ -130,11 +150,45 @@ class MontrealRoleScraper:
             payload["status"] = "ok"
             payload["last_fetched_at"] = dt.datetime.utcnow().isoformat()
             payload["source_url"] = self.page.url
-            self.cache.set(query.cache_key, payload, payload["last_fetched_at"])
+            entry = (query.cache_key, dict(payload), payload["last_fetched_at"])
+            if not self._cache_writer.is_alive():
+                # close() already stopped the writer
+                self.cache.set(*entry)
+                return payload
+            try:
+                self._cache_q.put_nowait(entry)
+            except queue.Full:
+                logger.debug("Cache write queue full, writing inline")
+                self.cache.set(*entry)
             return payload
         payload.setdefault("status", status)
         return payload
 
+    def close(self) -> None:
+        """Persist queued cache writes and stop the background writer."""
+        if self._cache_writer.is_alive():
+            self._cache_q.put(_STOP_WRITER)
+            self._cache_writer.join()
+
+    def _drain(self) -> None:
+        stopping = False
+        while not stopping:
+            # Block for one entry, then take whatever else is already queued so
+            # a burst of results lands in a single SQLite transaction.
+            batch = [self._cache_q.get()]
+            while True:
+                try:
+                    batch.append(self._cache_q.get_nowait())
+                except queue.Empty:
+                    break
+            entries = [entry for entry in batch if entry is not _STOP_WRITER]
+            stopping = len(entries) != len(batch)
+            try:
+                if entries:
+                    self.cache.set_many(entries)
+            except Exception as exc:
+                logger.warning("Failed to write %d cache entries: %s", len(entries), exc)
+
     @retryable(attempts=3)
     def _perform_search(self, query: AddressQuery):
         attempted_login = False
@@ -144,13 +198,12 @@ class MontrealRoleScraper:
             except PlaywrightTimeoutError:
                 logger.warning("Page load timeout, reloading...")
                 self.page.reload()
-            if self._on_login_page():
+            if self._on_login_page_fast():
                 logger.info("Authentication wall detected during navigation; attempting login")
                 if attempted_login or not self._ensure_authenticated():
                     return "error:auth_required", {}
                 attempted_login = True
                 continue
-            self.sleep()
             if not self._fill_form(query):
                 logger.error("Form filling failed")
                 return "error:form_fill_failed", {}
@@ -164,7 +217,6 @@ class MontrealRoleScraper:
                 continue
             if status != "ok":
                 return status, result
-            self.sleep()
             final_data = self._parse_final_page()
             return "ok", final_data
 
@@ -270,13 +322,10 @@ class MontrealRoleScraper:
         # Get street suggestion from API
         suggestion = {}
         try:
-            self.sleep()
             suggestion = self._best_street_suggestion(query)
             logger.debug(f"Got street suggestion: {suggestion.get('displayName', 'None')}")
         except Exception as e:
             logger.warning(f"Failed to get street suggestion: {type(e).__name__}: {e}")
-        finally:
-            self.sleep()
 
         # Determine street value to use
         street_value = suggestion.get("displayName") or suggestion.get("fullStreetName")
@@ -359,7 +408,7 @@ class MontrealRoleScraper:
         Returns:
             Tuple of (status, result_data)
         """
-        if self._on_login_page():
+        if self._on_login_page_fast():
             return "auth_required", {}
 
         # Wait for results page to load
@@ -397,6 +446,8 @@ class MontrealRoleScraper:
 
         # Try to match the address
         normalized_target = _normalize_address(query)
+        # Results usually share the street and differ by number; reject those early
+        civic_prefix = _normalize(query.civic_number)
         matched_index = None
 
         for idx in range(count):
@@ -410,6 +461,9 @@ class MontrealRoleScraper:
 
                 logger.debug(f"Comparing item {idx + 1}: '{address_text}' -> '{normalized_item}'")
 
+                if not normalized_item.startswith(civic_prefix):
+                    continue
+
                 if normalized_item == normalized_target:
                     matched_index = idx
                     logger.info(f"Found exact match at index {idx}: {address_text}")
@@ -452,7 +506,7 @@ class MontrealRoleScraper:
             return "error:timeout", {}
 
         # Check if redirected to login
-        if self._on_login_page():
+        if self._on_login_page_fast():
             logger.warning("Redirected to login page after address selection")
             return "auth_required", {}
 
@@ -468,7 +522,7 @@ class MontrealRoleScraper:
     def _parse_final_page(self) -> Dict[str, str]:
         next_data = None
         try:
-            next_data = self.page.evaluate("() => window.__NEXT_DATA__ || null")
+            next_data = self.page.evaluate(NEXT_DATA_SCRIPT)
         except Exception as exc:
             logger.debug("Unable to evaluate __NEXT_DATA__: %s", exc)
         if isinstance(next_data, dict):
@@ -512,17 +566,23 @@ class MontrealRoleScraper:
         try:
             with urllib.request.urlopen(request) as response:
                 payload = json.loads(response.read().decode("utf-8"))
-                status = getattr(response, "status", 200)
-                if status >= 500:
-                    raise urllib.error.HTTPError(url, status, "Server error", hdrs=None, fp=None)
+                if _header_float(response.headers, "X-RateLimit-Remaining", 999.0) < 5:
+                    self.rate.slow_down()
+                else:
+                    self.rate.speed_up()
         except urllib.error.HTTPError as exc:
+            if exc.code == 429:
+                self.rate.penalize(_header_float(exc.headers, "Retry-After", 2.0))
+                if not self.delay_after_actions:
+                    # self.sleep() is a no-op here, so honour Retry-After before the retry
+                    self.rate.sleep()
+            elif exc.code >= 500:
+                self.rate.slow_down()
             if exc.code == 429 or exc.code >= 500:
                 logger.warning("Street suggestion API throttled (%s), retrying", exc.code)
                 raise
             logger.debug("Street suggestion HTTP error %s", exc.code)
             return {}
-        finally:
-            self.sleep()
         suggestions = payload.get("data") or payload
         if not suggestions:
             return {}
@@ -553,22 +613,37 @@ class MontrealRoleScraper:
         # Last resort: return first suggestion
         return suggestions[0]
 
-    def _on_login_page(self) -> bool:
+    def _on_login_page_fast(self) -> bool:
         """
-        Check if currently on a login page.
+        Check the current URL for login redirects.
+
+        This is the hot-path check: it never touches the DOM, so it costs no
+        round-trip to the browser.
 
         Returns:
-            True if on login page, False otherwise
+            True if the URL looks like a login page, False otherwise
         """
-        # Check URL for login patterns
         try:
-            current_url = self.page.url.lower()
-            for pattern in URL_PATTERNS["login_patterns"]:
-                if pattern in current_url:
-                    logger.debug(f"Login page detected via URL pattern: {pattern}")
-                    return True
+            match = _LOGIN_URL_RE.search(self.page.url.lower())
         except Exception as e:
             logger.debug(f"Failed to get current URL: {type(e).__name__}: {e}")
+            return False
+        if match:
+            logger.debug(f"Login page detected via URL pattern: {match.group(0)}")
+            return True
+        return False
+
+    def _on_login_page_deep(self) -> bool:
+        """
+        Check if currently on a login page, including embedded login forms.
+
+        Falls back to scanning the login selectors when the URL check misses.
+
+        Returns:
+            True if on login page, False otherwise
+        """
+        if self._on_login_page_fast():
+            return True
 
         # Check for login form elements
         try:
@@ -623,7 +698,7 @@ class MontrealRoleScraper:
             return False
 
         # Verify we're not on login page
-        is_authenticated = not self._on_login_page()
+        is_authenticated = not self._on_login_page_deep()
 
         if is_authenticated:
             logger.info("Auto-login successful")
@@ -633,6 +708,16 @@ class MontrealRoleScraper:
         return is_authenticated
 
 
+def _header_float(headers, name: str, default: float) -> float:
+    value = headers.get(name) if headers is not None else None
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
 def _normalize_address(query: AddressQuery) -> str:
     if query.civic_number and query.street_name:
         return _normalize(f"{query.civic_number} {query.street_name}")
@@ -651,48 +736,57 @@ def _candidate_next_data_urls(next_data: Dict[str, Any]) -> List[str]:
     if not build_id:
         return []
     locale = next_data.get("locale") or next_data.get("defaultLocale") or "fr-CA"
+    asset_prefix = next_data.get("assetPrefix") or ""
+    return list(_next_data_urls(build_id, locale, asset_prefix))
+
+
+@functools.lru_cache(maxsize=8)
+def _next_data_urls(build_id: str, locale: str, asset_prefix: str) -> Tuple[str, ...]:
+    # Keyed on the deployment identity so the URLs are only rebuilt when Next.js redeploys.
     path = "/role-evaluation-fonciere/adresse/liste"
     urls: List[str] = []
     base = "https://montreal.ca"
     urls.append(f"{base}/_next/data/{build_id}/{locale}{path}.json")
-    asset_prefix = next_data.get("assetPrefix") or ""
     asset_prefix = asset_prefix.rstrip("/")
     if asset_prefix and asset_prefix != "/":
         prefixed = f"{base}{asset_prefix}/_next/data/{build_id}/{locale}{path}.json"
         if prefixed not in urls:
             urls.append(prefixed)
-    return urls
+    return tuple(urls)
+
+
+_CIVIC_COLUMNS = ("civicNumber", "civic_number", "CIVIQUE_DEBUT", "civique_debut")
+_STREET_COLUMNS = ("streetName", "street_name", "NOM_RUE", "nom_rue")
+_ADDRESS_COLUMNS = ("address", "Adresse")
+_NEIGHBORHOOD_COLUMNS = (
+    "NO_ARROND_ILE_CUM",
+    "no_arrond_ile_cum",
+    "neighborhood",
+    "neighbourhood",
+    "arrondissement",
+    "borough",
+)
+_RAW_ADDRESS_RE = r"(\d+[a-zA-Z]?)\s+(.*)"
+
+
+def _first_value(row: Dict[str, str], columns) -> Optional[str]:
+    for column in columns:
+        value = row.get(column)
+        if value:
+            return value
+    return None
 
 
 def parse_input_row(row: Dict[str, str]) -> Optional[AddressQuery]:
-    civic_number = clean_number(
-        row.get("civicNumber") or
-        row.get("civic_number") or
-        row.get("CIVIQUE_DEBUT") or
-        row.get("civique_debut")
-    )
-    street_name = (
-        row.get("streetName") or
-        row.get("street_name") or
-        row.get("NOM_RUE") or
-        row.get("nom_rue") or
-        ""
-    ).strip()
-    raw_address = row.get("address") or row.get("Adresse") or ""
-    
+    civic_number = clean_number(_first_value(row, _CIVIC_COLUMNS))
+    street_name = (_first_value(row, _STREET_COLUMNS) or "").strip()
+    raw_address = _first_value(row, _ADDRESS_COLUMNS) or ""
+
     # Extract neighborhood from various possible column names
-    neighborhood = (
-        row.get("NO_ARROND_ILE_CUM") or 
-        row.get("no_arrond_ile_cum") or 
-        row.get("neighborhood") or 
-        row.get("neighbourhood") or 
-        row.get("arrondissement") or 
-        row.get("borough") or 
-        ""
-    ).strip() or None
-    
+    neighborhood = (_first_value(row, _NEIGHBORHOOD_COLUMNS) or "").strip() or None
+
     if not civic_number and raw_address:
-        match = re.match(r"(\d+[a-zA-Z]?)\s+(.*)", raw_address)
+        match = re.match(_RAW_ADDRESS_RE, raw_address)
         if match:
             civic_number = match.group(1)
             street_name = street_name or match.group(2)
@@ -707,6 +801,54 @@ def parse_input_row(row: Dict[str, str]) -> Optional[AddressQuery]:
     )
 
 
+def parse_input_frame(path) -> List[AddressQuery]:
+    """
+    Parse every row of an input CSV into address queries in one vectorized pass.
+
+    Mirrors ``parse_input_row`` column-for-column but runs the cleanup as pandas
+    string operations over whole columns; rows missing a civic number or street
+    name are dropped rather than returned as ``None``.
+    """
+    import pandas as pd
+
+    df = pd.read_csv(path, dtype=str, keep_default_na=False)
+
+    def first_column(columns):
+        result = pd.Series("", index=df.index, dtype=object)
+        for column in columns:
+            if column in df.columns:
+                values = df[column].fillna("").astype(object)
+                result = result.where(result != "", values)
+        return result
+
+    civic_number = first_column(_CIVIC_COLUMNS).str.replace(r"[^0-9a-zA-Z]", "", regex=True)
+    street_name = first_column(_STREET_COLUMNS).str.strip()
+    raw_address = first_column(_ADDRESS_COLUMNS)
+    neighborhood = first_column(_NEIGHBORHOOD_COLUMNS).str.strip()
+
+    needs_split = (civic_number == "") & (raw_address != "")
+    if needs_split.any():
+        parts = raw_address[needs_split].str.extract("^" + _RAW_ADDRESS_RE)
+        matched = parts[0].notna()
+        index = parts.index[matched]
+        civic_number.loc[index] = parts.loc[index, 0]
+        street_name.loc[index] = street_name.loc[index].where(
+            street_name.loc[index] != "", parts.loc[index, 1]
+        )
+        street_name = street_name.str.strip()
+
+    frame = pd.DataFrame(
+        {
+            "civic_number": civic_number,
+            "street_name": street_name,
+            "raw_address": raw_address.where(raw_address != "", civic_number + " " + street_name),
+            "neighborhood": neighborhood.where(neighborhood != "", None),
+        }
+    )
+    frame = frame[(frame["civic_number"] != "") & (frame["street_name"] != "")]
+    return [AddressQuery(**record) for record in frame.to_dict("records")]
+
+
 def clean_number(value: Optional[str]) -> str:
     if not value:
         return ""
@@ -1,62 +1,177 @@
+import hashlib
 import json
 import re
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 from selectolax.parser import HTMLParser
 
 from .schema import OUTPUT_COLUMNS
 
-
-OWNER_CORP_KEYWORDS = ["inc", "ltée", "québec inc", "corp", "corporation"]
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def _dumps(value: Any) -> str:
+    """Serialize to compact UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+OWNER_CORP_KEYWORDS = ("inc", "ltée", "québec inc", "corp", "corporation")
+
+_WS_RE = re.compile(r"\s+")
+_MONEY_RE = re.compile(r"[^0-9.-]")
+_PCT_RE = re.compile(r"[^0-9.,]")
+# One alternation over every keyword, longest first, so adding a keyword
+# above needs no other change and the whole name is scanned once in C.
+_CORP_RE = re.compile(
+    r"\b(?:" + "|".join(re.escape(k) for k in sorted(OWNER_CORP_KEYWORDS, key=len, reverse=True)) + r")\b",
+    re.IGNORECASE,
+)
+
+
+def _keyword_re(*keywords: str) -> "re.Pattern[str]":
+    """Compile a case-insensitive substring match for any of ``keywords``."""
+    return re.compile("|".join(re.escape(k) for k in keywords), re.IGNORECASE)
+
+
+# CSS selectors for the result page, hoisted so every parse reuses the same strings.
+_HEADER_EXTRAS_SELECTOR = "header.page-header .content-header-extras .list-inline-item div"
+_OWNER_ITEM_SELECTOR = "ul.list > li.list-item"
+_OWNER_VALUE_SELECTOR = ".list-item-content"
+_BUILDING_HEADING_SELECTOR = "h3.h4"
+_SUBSECTION_SELECTOR = "section, div"
+
+# JSON payload lookups, all resolved by a single walk in _collect_json_fields.
+_SCALAR_FIELDS = ("municipality", "fiscal_years", "matricule", "tax_account_number", "nb_logements")
+_KEY_FIELDS = {
+    "municipality": "municipality",
+    "municipalite": "municipality",
+    "boroughname": "municipality",
+    "fiscalyears": "fiscal_years",
+    "fiscal_years": "fiscal_years",
+    "fiscalperiod": "fiscal_years",
+    "perioderole": "fiscal_years",
+    "matricule": "matricule",
+    "matriculenumber": "matricule",
+    "matriculenumberformatted": "matricule",
+    "taxaccountnumber": "tax_account_number",
+    "numerocomptefoncier": "tax_account_number",
+    "taxaccount": "tax_account_number",
+    "nblogements": "nb_logements",
+    "nombrelogements": "nb_logements",
+    "numberofdwellings": "nb_logements",
+}
+_SCALAR_FIELD_COUNT = len(_SCALAR_FIELDS)
+_LABEL_FIELDS = (
+    ("municipality", _keyword_re("municipalité", "arrondissement")),
+    ("fiscal_years", _keyword_re("période du rôle", "période du role", "années financières")),
+    ("matricule", _keyword_re("numéro de matricule")),
+    ("tax_account_number", _keyword_re("numéro de compte foncier")),
+    ("nb_logements", _keyword_re("nombre de logements")),
+)
+_TITLED_SECTIONS = (
+    ("role_courant", _keyword_re("rôle courant", "role courant")),
+    ("role_anterieur", _keyword_re("rôle antérieur", "role anterieur", "rôle anterieur", "role antérieur")),
+    ("distribution", _keyword_re("répartition", "repartition", "distribution")),
+    ("owners", _keyword_re("propriétaire", "proprietaires", "owners")),
+)
+_TITLED_SECTION_COUNT = len(_TITLED_SECTIONS)
+# Already lowercased (or exact-case) so hot-loop membership tests are a single hash lookup.
+_OWNER_LIST_KEYS = frozenset({"owners", "proprietaires", "ownerslist"})
+_LABEL_KEYS = frozenset({"label", "title", "name", "heading"})
+_TITLE_KEYS = frozenset({"title", "label", "name", "heading", "id", "slug", "anchor"})
+_VALUE_KEYS = ("value", "text", "content", "valueText")
+# Priority of each label/value key when a node carries several (lower wins).
+_LABEL_RANK = {"label": 0, "title": 1, "name": 2, "heading": 3}
+_VALUE_RANK = {key: rank for rank, key in enumerate(_VALUE_KEYS)}
+_DISTRIBUTION_HEADERS = frozenset({"sous-catégorie", "sous-categorie", "catégorie", "categorie"})
+_MEANINGFUL_FIELDS = ("owner_names", "matricule", "tax_account_number", "municipality", "assessed_total_current")
+_EMPTY_ROW: Dict[str, str] = dict.fromkeys(OUTPUT_COLUMNS, "")
+
+# Parsed result pages keyed by a digest of the raw HTML; retries and
+# duplicate addresses hand back byte-identical pages.
+_PARSE_CACHE_MAX = 512
+_parse_cache: Dict[bytes, Dict[str, str]] = {}
 
 
 def clean_text(value: Optional[str]) -> str:
     if not value:
         return ""
-    return re.sub(r"\s+", " ", value).strip()
+    return _WS_RE.sub(" ", value).strip()
 
 
 def parse_money(value: str) -> str:
     value = value.replace("\xa0", " ")
-    digits = re.sub(r"[^0-9.-]", "", value)
+    digits = _MONEY_RE.sub("", value)
     return digits
 
 
 def parse_percentage(value: str) -> str:
-    return re.sub(r"[^0-9.,]", "", value).replace(",", ".")
+    return _PCT_RE.sub("", value).replace(",", ".")
+
+
+def _owner_type(owner_names: str) -> str:
+    return "corporation" if _CORP_RE.search(owner_names) else "person"
 
 
 def parse_result_page(html: str) -> Dict[str, str]:
+    key = hashlib.blake2b(html.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    cached = _parse_cache.get(key)
+    if cached is not None:
+        return dict(cached)
+    result = _parse_result_page(html)
+    if len(_parse_cache) >= _PARSE_CACHE_MAX:
+        _parse_cache.clear()
+    _parse_cache[key] = result
+    # Callers mutate the row they get back, so never hand out the cached dict.
+    return dict(result)
+
+
+def parse_many(htmls: Sequence[str], max_workers: Optional[int] = None) -> List[Dict[str, str]]:
+    """
+    Parse several result pages in parallel, preserving input order.
+
+    Uses a process pool to sidestep the GIL, or a thread pool on free-threaded
+    interpreters where threads already run in parallel.
+    """
+    if len(htmls) < 2:
+        return [parse_result_page(html) for html in htmls]
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    executor_cls = ProcessPoolExecutor if gil_enabled else ThreadPoolExecutor
+    with executor_cls(max_workers=max_workers) as pool:
+        return list(pool.map(parse_result_page, htmls, chunksize=16))
+
+
+def _parse_result_page(html: str) -> Dict[str, str]:
     tree = HTMLParser(html)
-    data: Dict[str, str] = {col: "" for col in OUTPUT_COLUMNS}
+    data: Dict[str, str] = _EMPTY_ROW.copy()
 
-    municipality_node = tree.css_first(
-        "header.page-header .content-header-extras .list-inline-item div div:nth-child(1)"
-    )
-    if municipality_node:
-        data["municipality"] = clean_text(municipality_node.text())
-
-    fiscal_node = tree.css_first(
-        "header.page-header .content-header-extras .list-inline-item div div:nth-child(2)"
-    )
-    if fiscal_node:
-        data["fiscal_years"] = clean_text(fiscal_node.text())
+    header_extras = tree.css_first(_HEADER_EXTRAS_SELECTOR)
+    if header_extras:
+        # Municipality and fiscal years are the first two child divs
+        cells = [child for child in header_extras.iter() if child.tag == "div"]
+        if cells:
+            data["municipality"] = clean_text(cells[0].text())
+        if len(cells) > 1:
+            data["fiscal_years"] = clean_text(cells[1].text())
 
     owners_section = _section_by_heading(tree, "proprietaires")
     owner_names: List[str] = []
     if owners_section:
-        for item in owners_section.css("ul.list > li.list-item"):
-            value_node = item.css_first(".list-item-content")
+        for item in owners_section.css(_OWNER_ITEM_SELECTOR):
+            value_node = item.css_first(_OWNER_VALUE_SELECTOR)
             value_text = clean_text(value_node.text() if value_node else "")
             if value_text:
                 owner_names.append(value_text)
         if owner_names:
             data["owner_names"] = "; ".join(owner_names)
-            owner_type = "person"
-            lowered = data["owner_names"].lower()
-            if any(keyword in lowered for keyword in OWNER_CORP_KEYWORDS):
-                owner_type = "corporation"
-            data["owner_type"] = owner_type
+            data["owner_type"] = _owner_type(data["owner_names"])
         else:
             data["owner_type"] = "unknown"
     else:
@@ -72,7 +187,7 @@ def parse_result_page(html: str) -> Dict[str, str]:
 
     building_section = _section_by_heading(tree, "caracteristiques")
     if building_section:
-        for heading in building_section.css("h3.h4"):
+        for heading in building_section.css(_BUILDING_HEADING_SELECTOR):
             if "Caractéristiques du bâtiment principal" in heading.text():
                 list_mapping = _parse_dl_list(building_section)
                 if "Nombre de logements" in list_mapping:
@@ -87,8 +202,7 @@ def parse_result_page(html: str) -> Dict[str, str]:
         distribution = []
         table = distribution_section.css_first("table")
         if table:
-            for row in table.css("tr"):
-                cells = [clean_text(td.text()) for td in row.css("th, td")]
+            for cells in _table_rows(table):
                 if len(cells) >= 2 and cells[0].lower() != "sous-catégorie":
                     distribution.append(
                         {
@@ -97,7 +211,7 @@ def parse_result_page(html: str) -> Dict[str, str]:
                         }
                     )
         if distribution:
-            data["tax_distribution_json"] = json.dumps(distribution, ensure_ascii=False)
+            data["tax_distribution_json"] = _dumps(distribution)
 
     return data
 
@@ -107,10 +221,9 @@ def parse_result_json(payload: Dict[str, Any]) -> Dict[str, str]:
     if _has_meaningful_data(normalized):
         return normalized
 
-    html_candidates = list(_extract_html_candidates(payload))
-    if not html_candidates:
-        raise ValueError("No usable content found in JSON payload")
-    for candidate in html_candidates:
+    found = False
+    for candidate in _extract_html_candidates(payload):
+        found = True
         if not candidate:
             continue
         try:
@@ -119,45 +232,26 @@ def parse_result_json(payload: Dict[str, Any]) -> Dict[str, str]:
             continue
         if _has_meaningful_data(result):
             return result
+    if not found:
+        raise ValueError("No usable content found in JSON payload")
     raise ValueError("Unable to parse JSON payload with available content")
 
 
 def _normalize_json_payload(payload: Dict[str, Any]) -> Dict[str, str]:
-    data: Dict[str, str] = {col: "" for col in OUTPUT_COLUMNS}
+    data: Dict[str, str] = _EMPTY_ROW.copy()
     data["owner_type"] = "unknown"
 
-    municipality = _find_string_by_keys(payload, ["municipality", "municipalite", "boroughName"])
-    if not municipality:
-        municipality = _find_value_by_label(payload, ["Municipalité", "Arrondissement"])
-    data["municipality"] = municipality
+    by_key, by_label, sections, owner_list = _collect_json_fields(payload)
+    for field in _SCALAR_FIELDS:
+        # Explicit keys win over "label/value" pairs found anywhere in the payload
+        data[field] = by_key.get(field) or by_label.get(field, "")
 
-    fiscal_years = _find_string_by_keys(payload, ["fiscalYears", "fiscal_years", "fiscalPeriod", "periodeRole"])
-    if not fiscal_years:
-        fiscal_years = _find_value_by_label(payload, ["Période du rôle", "Période du role", "Années financières"])
-    data["fiscal_years"] = fiscal_years
-
-    owners = _extract_owner_names(payload)
+    owners = _extract_owner_names(owner_list, sections.get("owners"))
     if owners:
         data["owner_names"] = "; ".join(owners)
-        lowered = data["owner_names"].lower()
-        data["owner_type"] = "corporation" if any(keyword in lowered for keyword in OWNER_CORP_KEYWORDS) else "person"
-
-    matricule = _find_string_by_keys(payload, ["matricule", "matriculeNumber", "matriculeNumberFormatted"])
-    if not matricule:
-        matricule = _find_value_by_label(payload, ["Numéro de matricule"])
-    data["matricule"] = matricule
-
-    tax_account = _find_string_by_keys(payload, ["taxAccountNumber", "numeroCompteFoncier", "taxAccount"])
-    if not tax_account:
-        tax_account = _find_value_by_label(payload, ["Numéro de compte foncier"])
-    data["tax_account_number"] = tax_account
+        data["owner_type"] = _owner_type(data["owner_names"])
 
-    nb_logements = _find_string_by_keys(payload, ["nbLogements", "nombreLogements", "numberOfDwellings"])
-    if not nb_logements:
-        nb_logements = _find_value_by_label(payload, ["Nombre de logements"])
-    data["nb_logements"] = nb_logements
-
-    role_courant = _find_node_by_title(payload, ["rôle courant", "role courant"])
+    role_courant = sections.get("role_courant")
     courant_mapping = _extract_labeled_values(role_courant) if role_courant else {}
     if courant_mapping:
         if "Terrain" in courant_mapping:
@@ -168,15 +262,15 @@ def _normalize_json_payload(payload: Dict[str, Any]) -> Dict[str, str]:
         if "Total" in courant_mapping:
             data["assessed_total_current"] = parse_money(courant_mapping["Total"])
 
-    role_anterieur = _find_node_by_title(payload, ["rôle antérieur", "role anterieur", "rôle anterieur", "role antérieur"])
+    role_anterieur = sections.get("role_anterieur")
     anterieur_mapping = _extract_labeled_values(role_anterieur) if role_anterieur else {}
     if anterieur_mapping and "Total" in anterieur_mapping:
         data["assessed_total_previous"] = parse_money(anterieur_mapping["Total"])
 
-    distribution_node = _find_node_by_title(payload, ["répartition", "repartition", "distribution"])
+    distribution_node = sections.get("distribution")
     distribution_rows = _extract_distribution_rows(distribution_node) if distribution_node else []
     if distribution_rows:
-        data["tax_distribution_json"] = json.dumps(distribution_rows, ensure_ascii=False)
+        data["tax_distribution_json"] = _dumps(distribution_rows)
 
     return data
 
@@ -189,9 +283,11 @@ def _extract_html_candidates(node: Any, seen: Optional[Set[int]] = None) -> Iter
         return
     seen.add(obj_id)
     if isinstance(node, str):
-        snippet = node.strip()
-        if "<" in snippet and ">" in snippet and any(marker in snippet for marker in ("<section", "<header", "<dl", "<div", "</")):
-            yield snippet
+        # Cheapest rejection first: most strings have no "<" and are never copied by strip()
+        if "<" not in node or ">" not in node:
+            return
+        if "</" in node or "<div" in node or "<section" in node or "<header" in node or "<dl" in node:
+            yield node.strip()
         return
     if isinstance(node, dict):
         for value in node.values():
@@ -202,88 +298,101 @@ def _extract_html_candidates(node: Any, seen: Optional[Set[int]] = None) -> Iter
 
 
 def _has_meaningful_data(result: Dict[str, str]) -> bool:
-    keys_to_check = {
-        "owner_names",
-        "matricule",
-        "tax_account_number",
-        "municipality",
-        "assessed_total_current",
-    }
-    return any(result.get(key) for key in keys_to_check)
+    return any(result.get(key) for key in _MEANINGFUL_FIELDS)
 
 
 def _walk_nodes(node: Any) -> Iterable[Any]:
-    if isinstance(node, dict):
-        yield node
-        for value in node.values():
-            yield from _walk_nodes(value)
-    elif isinstance(node, list):
-        for item in node:
-            yield from _walk_nodes(item)
-
-
-def _find_string_by_keys(payload: Dict[str, Any], keys: Sequence[str]) -> str:
-    lowered = [key.lower() for key in keys]
-    for node in _walk_nodes(payload):
-        if not isinstance(node, dict):
+    # Explicit stack instead of recursive generators; children are pushed in
+    # reverse so dicts are still yielded in pre-order (first match semantics).
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            yield current
+            stack.extend(reversed(current.values()))
+        elif isinstance(current, list):
+            stack.extend(reversed(current))
+
+
+def _collect_json_fields(
+    payload: Dict[str, Any],
+) -> Tuple[Dict[str, str], Dict[str, str], Dict[str, Dict[str, Any]], Optional[List[Any]]]:
+    """
+    Gather every field ``_normalize_json_payload`` needs in a single walk.
+
+    Returns the values found under known keys, the values found next to known
+    labels, the first node titled like each known section, and the first
+    non-empty owners list. Each entry keeps the first match in walk order.
+    The walk stops as soon as nothing it could still find would be used.
+    """
+    by_key: Dict[str, str] = {}
+    by_label: Dict[str, str] = {}
+    sections: Dict[str, Dict[str, Any]] = {}
+    owner_list: Optional[List[Any]] = None
+    # Same pre-order walk as _walk_nodes, inlined so it can return early.
+    stack: List[Any] = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(reversed(node))
             continue
-        for key, value in node.items():
-            if key.lower() in lowered and isinstance(value, str):
-                cleaned = clean_text(value)
-                if cleaned:
-                    return cleaned
-    return ""
-
-
-def _find_list_by_keys(payload: Dict[str, Any], keys: Sequence[str]) -> Optional[List[Any]]:
-    lowered = [key.lower() for key in keys]
-    for node in _walk_nodes(payload):
         if not isinstance(node, dict):
             continue
+        # Lowercase each key once per node; label/title texts are matched
+        # as-is by the case-insensitive keyword patterns below.
+        label_texts: List[str] = []
+        title_texts: List[str] = []
         for key, value in node.items():
-            if key.lower() in lowered and isinstance(value, list) and value:
-                return value
-    return None
-
-
-def _find_value_by_label(payload: Dict[str, Any], labels: Sequence[str]) -> str:
-    labels_lower = [label.lower() for label in labels]
-    for node in _walk_nodes(payload):
-        if not isinstance(node, dict):
-            continue
-        candidate = None
-        for key in ("label", "title", "name", "heading"):
-            value = node.get(key)
-            if isinstance(value, str) and any(label in value.lower() for label in labels_lower):
-                candidate = value
-                break
-        if candidate:
-            for value_key in ("value", "text", "content", "valueText"):
-                value = node.get(value_key)
-                if isinstance(value, str):
+            lowered = key.lower()
+            if isinstance(value, str):
+                field = _KEY_FIELDS.get(lowered)
+                if field and field not in by_key:
                     cleaned = clean_text(value)
                     if cleaned:
-                        return cleaned
-            values = node.get("values")
-            if isinstance(values, list):
-                texts = [clean_text(v) for v in values if isinstance(v, str) and clean_text(v)]
-                if texts:
-                    return "; ".join(texts)
+                        by_key[field] = cleaned
+                if key in _TITLE_KEYS:
+                    title_texts.append(value)
+                    if key in _LABEL_KEYS:
+                        label_texts.append(value)
+            elif owner_list is None and isinstance(value, list) and value and lowered in _OWNER_LIST_KEYS:
+                owner_list = value
+        if label_texts:
+            for field, pattern in _LABEL_FIELDS:
+                if field not in by_label and _texts_match(label_texts, pattern):
+                    value = _node_value(node)
+                    if value:
+                        by_label[field] = value
+        if title_texts:
+            for name, pattern in _TITLED_SECTIONS:
+                if name not in sections and _texts_match(title_texts, pattern):
+                    sections[name] = node
+        # Explicit keys win over labels, so once every scalar, section and the
+        # owners list is known the rest of the payload cannot change the result.
+        if owner_list is not None and len(by_key) == _SCALAR_FIELD_COUNT and len(sections) == _TITLED_SECTION_COUNT:
+            break
+        stack.extend(reversed(node.values()))
+    return by_key, by_label, sections, owner_list
+
+
+def _texts_match(texts: Sequence[str], pattern: "re.Pattern[str]") -> bool:
+    return any(pattern.search(text) for text in texts)
+
+
+def _node_value(node: Dict[str, Any]) -> str:
+    for value_key in _VALUE_KEYS:
+        value = node.get(value_key)
+        if isinstance(value, str):
+            cleaned = clean_text(value)
+            if cleaned:
+                return cleaned
+    values = node.get("values")
+    if isinstance(values, list):
+        texts = [clean_text(v) for v in values if isinstance(v, str) and clean_text(v)]
+        if texts:
+            return "; ".join(texts)
     return ""
 
 
-def _find_node_by_title(payload: Dict[str, Any], keywords: Sequence[str]) -> Optional[Dict[str, Any]]:
-    keywords_lower = [keyword.lower() for keyword in keywords]
-    for node in _walk_nodes(payload):
-        if not isinstance(node, dict):
-            continue
-        for key in ("title", "label", "name", "heading", "id", "slug", "anchor"):
-            value = node.get(key)
-            if isinstance(value, str) and any(keyword in value.lower() for keyword in keywords_lower):
-                return node
-    return None
-
-
 def _extract_labeled_values(node: Optional[Dict[str, Any]]) -> Dict[str, str]:
     if node is None:
         return {}
@@ -291,27 +400,33 @@ def _extract_labeled_values(node: Optional[Dict[str, Any]]) -> Dict[str, str]:
     for sub_node in _walk_nodes(node):
         if not isinstance(sub_node, dict):
             continue
-        label_text = None
-        for key in ("label", "title", "name", "heading"):
-            if key in sub_node and isinstance(sub_node[key], str):
-                candidate = clean_text(sub_node[key])
+        # One pass over the node's items, keeping the best-ranked non-empty
+        # label and value so key priority matches the declared order.
+        label_text = value_text = None
+        label_rank, value_rank = len(_LABEL_RANK), len(_VALUE_RANK)
+        for key, raw in sub_node.items():
+            if not isinstance(raw, str):
+                continue
+            rank = _LABEL_RANK.get(key)
+            if rank is not None and rank < label_rank:
+                candidate = clean_text(raw)
                 if candidate:
-                    label_text = candidate
-                    break
+                    label_text, label_rank = candidate, rank
+            rank = _VALUE_RANK.get(key)
+            if rank is not None and rank < value_rank:
+                candidate = clean_text(raw)
+                if candidate:
+                    value_text, value_rank = candidate, rank
         if not label_text:
             continue
-        for value_key in ("value", "text", "content", "valueText"):
-            if value_key in sub_node and isinstance(sub_node[value_key], str):
-                cleaned = clean_text(sub_node[value_key])
-                if cleaned:
-                    mapping[label_text] = cleaned
-                    break
-        else:
-            values = sub_node.get("values")
-            if isinstance(values, list):
-                texts = [clean_text(v) for v in values if isinstance(v, str) and clean_text(v)]
-                if texts:
-                    mapping[label_text] = "; ".join(texts)
+        if value_text:
+            mapping[label_text] = value_text
+            continue
+        values = sub_node.get("values")
+        if isinstance(values, list):
+            texts = [clean_text(v) for v in values if isinstance(v, str) and clean_text(v)]
+            if texts:
+                mapping[label_text] = "; ".join(texts)
     return mapping
 
 
@@ -338,7 +453,7 @@ def _extract_distribution_rows(node: Optional[Dict[str, Any]]) -> List[Dict[str,
         if not values or len(values) < 2:
             continue
         header = values[0].lower()
-        if header in {"sous-catégorie", "sous-categorie", "catégorie", "categorie"}:
+        if header in _DISTRIBUTION_HEADERS:
             continue
         distribution.append(
             {
@@ -360,7 +475,7 @@ def _row_to_values(row: Any) -> List[str]:
                 if label:
                     values.append(label)
                     break
-        for key in ("value", "text", "content", "valueText"):
+        for key in _VALUE_KEYS:
             if key in row and isinstance(row[key], str):
                 val = clean_text(row[key])
                 if val:
@@ -393,18 +508,18 @@ def _coerce_string(value: Any) -> str:
     return ""
 
 
-def _extract_owner_names(payload: Dict[str, Any]) -> List[str]:
+def _extract_owner_names(
+    owner_list: Optional[List[Any]], owner_section: Optional[Dict[str, Any]]
+) -> List[str]:
     owners: List[str] = []
-    direct_list = _find_list_by_keys(payload, ["owners", "proprietaires", "ownersList"])
-    if direct_list:
-        for entry in direct_list:
+    if owner_list:
+        for entry in owner_list:
             candidate = _coerce_string(entry)
             if candidate and "numéro" not in candidate.lower():
                 owners.append(candidate)
     if owners:
         return owners
 
-    owner_section = _find_node_by_title(payload, ["propriétaire", "proprietaires", "owners"])
     if not owner_section:
         return owners
     for sub_node in _walk_nodes(owner_section):
@@ -427,22 +542,34 @@ def _section_by_heading(tree: HTMLParser, heading_id: str):
 
 def _parse_dl_list(node) -> Dict[str, str]:
     result: Dict[str, str] = {}
-    for dt in node.css("dt"):
-        dd = dt.next
-        while dd is not None and dd.tag != "dd":
-            dd = dd.next
-        if dd is None:
-            continue
-        label = clean_text(dt.text())
-        value = clean_text(dd.text())
-        if label:
-            result[label] = value
+    # One document-order pass; a <dt> pairs with the next <dd> among its own
+    # siblings, so <div>-grouped lists work and consecutive <dt>s share a <dd>.
+    # Slots keep <dt> order, so a repeated label still resolves to its last <dt>.
+    slots: List[List[str]] = []
+    pending: Dict[int, List[List[str]]] = {}
+    for child in node.traverse():
+        tag = child.tag
+        if tag == "dt":
+            label = clean_text(child.text())
+            if label:
+                slot = [label]
+                slots.append(slot)
+                pending.setdefault(child.parent.mem_id, []).append(slot)
+        elif tag == "dd":
+            waiting = pending.pop(child.parent.mem_id, None)
+            if waiting:
+                value = clean_text(child.text())
+                for slot in waiting:
+                    slot.append(value)
+    for slot in slots:
+        if len(slot) == 2:
+            result[slot[0]] = slot[1]
     return result
 
 
 def _parse_values(section) -> Dict[str, str]:
     data: Dict[str, str] = {}
-    for sub_section in section.css("section, div"):
+    for sub_section in section.css(_SUBSECTION_SELECTOR):
         heading = sub_section.css_first("h3")
         if not heading:
             continue
@@ -466,7 +593,24 @@ def _find_section_with_table(section):
         return None
     if section.css_first("table"):
         return section
-    for child in section.css("section, div"):
+    for child in section.css(_SUBSECTION_SELECTOR):
         if child.css_first("table"):
             return child
     return None
+
+
+def _table_rows(table) -> List[List[str]]:
+    """Group a table's cells into rows in a single pass over its subtree."""
+    rows: List[List[str]] = []
+    current: Optional[List[str]] = None
+    for node in table.traverse(include_text=False):
+        tag = node.tag
+        if tag == "tr":
+            if current is not None:
+                rows.append(current)
+            current = []
+        elif (tag == "td" or tag == "th") and current is not None:
+            current.append(clean_text(node.text()))
+    if current is not None:
+        rows.append(current)
+    return rows
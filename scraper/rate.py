@@ -1,3 +1,4 @@
+import functools
 import random
 import time
 from typing import Callable, Optional
@@ -6,27 +7,54 @@ from tenacity import retry, stop_after_attempt, wait_exponential
 
 
 class RateLimiter:
-    """Sleep with jitter between actions."""
+    """Sleep with jitter between actions, adapting to server rate-limit signals."""
 
-    def __init__(self, delay_min: float = 1.5, delay_max: float = 3.0) -> None:
+    def __init__(self, delay_min: float = 1.5, delay_max: float = 3.0, max_delay: float = 60.0) -> None:
         self.delay_min = delay_min
         self.delay_max = delay_max
+        self.max_delay = max_delay
+        self._base_min = delay_min
+        self._base_max = delay_max
 
     def sleep(self) -> None:
-        delay = random.uniform(self.delay_min, self.delay_max)
+        delay = random.random() * (self.delay_max - self.delay_min) + self.delay_min
         time.sleep(delay)
 
+    def slow_down(self, factor: float = 2.0) -> None:
+        """Widen the sleep window, capped at ``max_delay``."""
+        self._scale(factor)
 
-def retryable(func: Optional[Callable] = None, *, attempts: int = 3):
-    """Decorator applying tenacity retry with exponential backoff."""
+    def speed_up(self, factor: float = 0.75) -> None:
+        """Shrink the sleep window back towards the configured base delays."""
+        self._scale(factor)
+
+    def penalize(self, seconds: float) -> None:
+        """Raise the window so the next sleep lasts at least ``seconds`` (e.g. ``Retry-After``)."""
+        seconds = min(max(seconds, 0.0), self.max_delay)
+        if seconds <= self.delay_min:
+            return
+        span = self.delay_max - self.delay_min
+        self.delay_min = seconds
+        self.delay_max = min(seconds + span, self.max_delay)
+
+    def _scale(self, factor: float) -> None:
+        self.delay_min = min(max(self.delay_min * factor, self._base_min), self.max_delay)
+        self.delay_max = min(max(self.delay_max * factor, self._base_max), self.max_delay)
 
-    def decorator(fn: Callable) -> Callable:
-        return retry(
-            reraise=True,
-            stop=stop_after_attempt(attempts),
-            wait=wait_exponential(multiplier=1, min=1, max=10),
-        )(fn)
 
+@functools.lru_cache(maxsize=8)
+def _mk_retry(attempts: int) -> Callable[[Callable], Callable]:
+    """Build (once per ``attempts``) the tenacity decorator shared by ``retryable``."""
+    return retry(
+        reraise=True,
+        stop=stop_after_attempt(attempts),
+        wait=wait_exponential(multiplier=1, min=1, max=10),
+    )
+
+
+def retryable(func: Optional[Callable] = None, *, attempts: int = 3):
+    """Decorator applying tenacity retry with exponential backoff."""
+    decorator = _mk_retry(attempts)
     if func is None:
         return decorator
     return decorator(func)
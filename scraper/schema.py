@@ -1,3 +1,4 @@
+import functools
 import re
 from typing import Dict
 
@@ -22,6 +23,8 @@ OUTPUT_COLUMNS = [
 BOROUGH_COLUMN = "NO_ARROND_ILE_CUM"
 NORMALIZED_BOROUGH_FIELD = "_normalized_borough"
 
+_ALPHA_RE = re.compile(r"[^a-z]")
+
 CANONICAL_BOROUGH_NAMES = {
     "villeraysaintmichelparcextension",
     "westmount",
@@ -41,12 +44,13 @@ CANONICAL_BOROUGH_NAMES = {
 }
 
 
+@functools.lru_cache(maxsize=64)
 def normalize_borough(value: str) -> str:
-    """Normalize borough name for matching."""
+    """Normalize borough name for matching (memoized; boroughs repeat across rows)."""
     if not value:
         return ""
     normalized = value.lower()
-    normalized = re.sub(r"[^a-z]", "", normalized)
+    normalized = _ALPHA_RE.sub("", normalized)
     return normalized
 
 
@@ -1,3 +1,25 @@
+import os
+import sys
+
+
+def _find_native_package():
+    """Return the directory of an installed C-backed selectolax, if any."""
+    here = os.path.dirname(os.path.abspath(__file__))
+    for entry in sys.path:
+        candidate = os.path.join(os.path.abspath(entry or os.getcwd()), "selectolax")
+        if candidate == here or not os.path.isdir(candidate):
+            continue
+        if any(name.startswith("lexbor.") and name.endswith((".so", ".pyd")) for name in os.listdir(candidate)):
+            return candidate
+    return None
+
+
+# This package shadows the real selectolax; expose the installed wheel's
+# compiled modules as submodules so ``parser`` can delegate to them.
+_native_package = _find_native_package()
+if _native_package:
+    __path__.append(_native_package)
+
 from .parser import HTMLParser
 
 __all__ = ["HTMLParser"]
@@ -1,11 +1,33 @@
 from __future__ import annotations
 
+import bisect
+import functools
+import re
+import sys
 from html.parser import HTMLParser as _HTMLParser
-from typing import Callable, List, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+_EMPTY_FROZENSET: frozenset = frozenset()
+# An identifier in a compound selector runs until the next delimiter.
+_IDENT_RE = re.compile(r"[^.#:( ]*")
 
 
 class _Node:
-    __slots__ = ("tag", "attrs", "children", "parent", "text_parts")
+    __slots__ = (
+        "tag",
+        "attrs",
+        "children",
+        "parent",
+        "text_parts",
+        "index_in_parent",
+        "class_set",
+        "id_val",
+        "text_cache",
+        "wrapper",
+        "tree",
+        "pos",
+    )
 
     def __init__(self, tag: str, attrs: dict[str, str], parent: Optional["_Node"]) -> None:
         self.tag = tag
@@ -13,8 +35,19 @@ class _Node:
         self.parent = parent
         self.children: List[_Node] = []
         self.text_parts: List[str] = []
+        self.index_in_parent = 0
+        class_attr = attrs.get("class")
+        self.class_set = frozenset(class_attr.split()) if class_attr else _EMPTY_FROZENSET
+        self.id_val = attrs.get("id")
+        self.text_cache: Optional[str] = None
+        self.wrapper: Optional[NodeWrapper] = None
+        # Set by _FlatTree once the document is fully built.
+        self.tree: Optional[_FlatTree] = None
+        self.pos = 0
 
     def add_child(self, child: "_Node") -> None:
+        # The tree is built once and never mutated, so positions stay valid.
+        child.index_in_parent = len(self.children)
         self.children.append(child)
 
     def add_text(self, data: str) -> None:
@@ -27,12 +60,7 @@ class _Node:
             yield from child.iter_descendants()
 
     def sibling_index(self) -> int:
-        if not self.parent:
-            return 1
-        try:
-            return self.parent.children.index(self) + 1
-        except ValueError:
-            return 1
+        return self.index_in_parent + 1 if self.parent else 1
 
 
 class _TreeBuilder(_HTMLParser):
@@ -44,7 +72,9 @@ class _TreeBuilder(_HTMLParser):
     def handle_starttag(self, tag, attrs):
         attrs_dict = {name: value for name, value in attrs}
         parent = self.stack[-1]
-        node = _Node(tag, attrs_dict, parent)
+        # Interned so every node (and compiled selector) shares one string per
+        # tag name and tag comparisons usually short-circuit on identity.
+        node = _Node(sys.intern(tag), attrs_dict, parent)
         parent.add_child(node)
         self.stack.append(node)
 
@@ -59,10 +89,68 @@ class _TreeBuilder(_HTMLParser):
             self.stack[-1].add_text(data)
 
 
+_Predicate = Callable[["_FlatTree", int], bool]
+# (combinator, required tag or None, full predicate, predicate without the tag
+# check or None when the tag is the only condition) for one compound selector.
+_Step = Tuple[str, Optional[str], _Predicate, Optional[_Predicate]]
+
+
+class _FlatTree:
+    """
+    Pre-order arrays over a finished document for index-based selector matching.
+
+    Node ``i``'s descendants are exactly the indices ``[i + 1, subtree_end[i])``,
+    and its children are reached by hopping ``j = subtree_end[j]`` from ``i + 1``.
+    ``tag_index`` lists the positions of every tag, so a descendant step with a
+    tag only visits nodes that can match.
+    """
+
+    __slots__ = ("nodes", "tags", "ids", "class_sets", "sibling_positions", "subtree_end", "tag_index")
+
+    def __init__(self, root: _Node) -> None:
+        nodes: List[_Node] = []
+        depths: List[int] = []
+        stack = [(root, 0)]
+        while stack:
+            node, depth = stack.pop()
+            node.tree = self
+            node.pos = len(nodes)
+            nodes.append(node)
+            depths.append(depth)
+            stack.extend((child, depth + 1) for child in reversed(node.children))
+
+        subtree_end = [len(nodes)] * len(nodes)
+        open_nodes: List[int] = []
+        for i, depth in enumerate(depths):
+            while open_nodes and depths[open_nodes[-1]] >= depth:
+                subtree_end[open_nodes.pop()] = i
+            open_nodes.append(i)
+
+        self.nodes = nodes
+        self.tags = [node.tag for node in nodes]
+        self.ids = [node.id_val for node in nodes]
+        self.class_sets = [node.class_set for node in nodes]
+        self.sibling_positions = [node.index_in_parent + 1 for node in nodes]
+        self.subtree_end = subtree_end
+        # Ascending pre-order positions per tag; a subtree's matches are one bisected slice.
+        tag_index: Dict[str, List[int]] = {}
+        for i, tag in enumerate(self.tags):
+            tag_index.setdefault(tag, []).append(i)
+        self.tag_index = tag_index
+
+
 class NodeWrapper:
     def __init__(self, node: _Node):
         self._node = node
 
+    @classmethod
+    def of(cls, node: _Node) -> "NodeWrapper":
+        """Return the node's wrapper, creating it on first use."""
+        wrapper = node.wrapper
+        if wrapper is None:
+            wrapper = node.wrapper = cls(node)
+        return wrapper
+
     @property
     def tag(self) -> str:
         return self._node.tag
@@ -71,10 +159,15 @@ class NodeWrapper:
     def attrs(self) -> dict[str, str]:
         return self._node.attrs
 
+    @property
+    def mem_id(self) -> int:
+        """Stable identity of the underlying node, as exposed by the Lexbor engine."""
+        return id(self._node)
+
     @property
     def parent(self) -> Optional["NodeWrapper"]:
         if self._node.parent:
-            return NodeWrapper(self._node.parent)
+            return NodeWrapper.of(self._node.parent)
         return None
 
     @property
@@ -82,22 +175,33 @@ class NodeWrapper:
         if not self._node.parent:
             return None
         siblings = self._node.parent.children
-        try:
-            index = siblings.index(self._node)
-        except ValueError:
-            return None
-        if index + 1 < len(siblings):
-            return NodeWrapper(siblings[index + 1])
+        index = self._node.index_in_parent + 1
+        if index < len(siblings):
+            return NodeWrapper.of(siblings[index])
         return None
 
-    def text(self) -> str:
-        return "".join(self._collect_text(self._node)).strip()
+    def iter(self, include_text: bool = False) -> Iterator["NodeWrapper"]:
+        """Iterate over direct child elements (text is not stored as nodes here)."""
+        for child in self._node.children:
+            yield NodeWrapper.of(child)
+
+    def traverse(self, include_text: bool = False) -> Iterator["NodeWrapper"]:
+        """Iterate over this element and all descendants in document order."""
+        yield self
+        for descendant in self._node.iter_descendants():
+            yield NodeWrapper.of(descendant)
 
-    def _collect_text(self, node: _Node) -> List[str]:
-        parts = list(node.text_parts)
-        for child in node.children:
-            parts.extend(self._collect_text(child))
-        return parts
+    def text(self) -> str:
+        node = self._node
+        if node.text_cache is None:
+            # A subtree is a contiguous pre-order slice, so its text is every
+            # node's own parts in index order -- no recursion or copies.
+            tree = node.tree
+            nodes = tree.nodes
+            node.text_cache = "".join(
+                part for j in range(node.pos, tree.subtree_end[node.pos]) for part in nodes[j].text_parts
+            ).strip()
+        return node.text_cache
 
     def css(self, selector: str) -> List["NodeWrapper"]:
         return _css_select(self._node, selector)
@@ -112,6 +216,7 @@ class HTMLParser:
         parser = _TreeBuilder()
         parser.feed(html)
         self.root = parser.root
+        _FlatTree(self.root)
 
     def css(self, selector: str) -> List[NodeWrapper]:
         return _css_select(self.root, selector)
@@ -122,32 +227,55 @@ class HTMLParser:
 
 
 def _css_select(node: _Node, selector: str) -> List[NodeWrapper]:
-    selectors = [_parse_selector(part.strip()) for part in selector.split(",") if part.strip()]
-    results: List[_Node] = []
-    for sel in selectors:
-        results.extend(_select_single(node, sel))
-    return [NodeWrapper(n) for n in results]
-
-
-def _select_single(root: _Node, selector: List[Tuple[str, Callable[[_Node], bool]]]) -> List[_Node]:
-    current = [root]
-    for combinator, predicate in selector:
-        next_nodes: List[_Node] = []
-        for node in current:
+    tree = node.tree
+    results: List[int] = []
+    for sel in _compile_selector(selector):
+        results.extend(_select_single(tree, node.pos, sel))
+    nodes = tree.nodes
+    of = NodeWrapper.of
+    return [of(nodes[j]) for j in results]
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_selector(selector: str) -> Tuple[Tuple[_Step, ...], ...]:
+    """Parse a comma-separated selector once; predicates are pure, so results are reused."""
+    return tuple(tuple(_parse_selector(part.strip())) for part in selector.split(",") if part.strip())
+
+
+def _select_single(tree: _FlatTree, start: int, selector: Sequence[_Step]) -> List[int]:
+    subtree_end = tree.subtree_end
+    current = [start]
+    for combinator, tag, predicate, residual in selector:
+        next_nodes: List[int] = []
+        positions = tree.tag_index.get(tag, ()) if tag else None
+        for i in current:
+            end = subtree_end[i]
             if combinator == ">":
-                for child in node.children:
-                    if predicate(child):
-                        next_nodes.append(child)
+                j = i + 1
+                while j < end:
+                    if predicate(tree, j):
+                        next_nodes.append(j)
+                    j = subtree_end[j]
+            elif positions is not None:
+                lo = bisect.bisect_right(positions, i)
+                hi = bisect.bisect_left(positions, end, lo)
+                # Every indexed position already has the tag.
+                if residual is None:
+                    next_nodes.extend(positions[lo:hi])
+                else:
+                    for j in positions[lo:hi]:
+                        if residual(tree, j):
+                            next_nodes.append(j)
             else:
-                for descendant in node.iter_descendants():
-                    if predicate(descendant):
-                        next_nodes.append(descendant)
+                for j in range(i + 1, end):
+                    if predicate(tree, j):
+                        next_nodes.append(j)
         current = next_nodes
     return current
 
 
-def _parse_selector(selector: str) -> List[Tuple[str, Callable[[_Node], bool]]]:
-    tokens: List[Tuple[str, Callable[[_Node], bool]]] = []
+def _parse_selector(selector: str) -> List[_Step]:
+    tokens: List[_Step] = []
     buffer = ""
     combinator = None
     i = 0
@@ -155,14 +283,14 @@ def _parse_selector(selector: str) -> List[Tuple[str, Callable[[_Node], bool]]]:
         char = selector[i]
         if char == ">":
             if buffer.strip():
-                tokens.append((combinator or " ", _compile_simple_selector(buffer.strip())))
+                tokens.append((combinator or " ", *_compile_simple_selector(buffer.strip())))
                 buffer = ""
             combinator = ">"
             i += 1
             continue
         if char.isspace():
             if buffer.strip():
-                tokens.append((combinator or " ", _compile_simple_selector(buffer.strip())))
+                tokens.append((combinator or " ", *_compile_simple_selector(buffer.strip())))
                 buffer = ""
             combinator = " "
             while i < len(selector) and selector[i].isspace():
@@ -171,15 +299,15 @@ def _parse_selector(selector: str) -> List[Tuple[str, Callable[[_Node], bool]]]:
         buffer += char
         i += 1
     if buffer.strip():
-        tokens.append((combinator or " ", _compile_simple_selector(buffer.strip())))
+        tokens.append((combinator or " ", *_compile_simple_selector(buffer.strip())))
     if tokens:
-        first_combinator, predicate = tokens[0]
+        first_combinator, *compiled = tokens[0]
         if first_combinator != ">":
-            tokens[0] = ("descendant", predicate)
+            tokens[0] = ("descendant", *compiled)
     return tokens
 
 
-def _compile_simple_selector(selector: str) -> Callable[[_Node], bool]:
+def _compile_simple_selector(selector: str) -> Tuple[Optional[str], _Predicate, Optional[_Predicate]]:
     tag = None
     classes: List[str] = []
     element_id = None
@@ -208,25 +336,44 @@ def _compile_simple_selector(selector: str) -> Callable[[_Node], bool]:
             continue
         name, remainder = _read_identifier(remainder)
         if name:
-            tag = name
-    def predicate(node: _Node) -> bool:
-        if tag and node.tag != tag:
-            return False
-        if element_id and node.attrs.get("id") != element_id:
-            return False
-        if classes:
-            class_attr = node.attrs.get("class", "")
-            node_classes = set(class_attr.split())
-            if not all(cls in node_classes for cls in classes):
-                return False
-        if nth_child is not None and node.sibling_index() != nth_child:
-            return False
-        return True
-    return predicate
+            tag = sys.intern(name)
+    # Generate a predicate containing only the checks this selector needs;
+    # values are bound through the namespace, never spliced into the source.
+    checks = []
+    if element_id:
+        checks.append("tree.ids[j] == element_id")
+    if classes:
+        checks.append("required_classes.issubset(tree.class_sets[j])")
+    if nth_child is not None:
+        checks.append("tree.sibling_positions[j] == nth_child")
+    namespace = {
+        "tag": tag,
+        "element_id": element_id,
+        "required_classes": frozenset(classes),
+        "nth_child": nth_child,
+    }
+    residual = _build_predicate(checks, namespace) if checks else None
+    predicate = _build_predicate(["tree.tags[j] == tag", *checks] if tag else checks, namespace)
+    return tag or None, predicate, residual
+
+
+def _build_predicate(checks: List[str], namespace: dict) -> _Predicate:
+    source = "def predicate(tree, j):\n    return " + (" and ".join(checks) or "True") + "\n"
+    exec(compile(source, "<selector>", "exec"), namespace)
+    return namespace.pop("predicate")
 
 
 def _read_identifier(text: str) -> Tuple[str, str]:
-    i = 0
-    while i < len(text) and text[i] not in ".#:( ":
-        i += 1
-    return text[:i], text[i:]
+    end = _IDENT_RE.match(text).end()
+    return text[:end], text[end:]
+
+
+# Kept importable under its own name so tests can exercise both engines.
+PythonHTMLParser = HTMLParser
+
+try:
+    # Prefer the C-backed Lexbor engine from an installed selectolax wheel; its
+    # nodes expose the css/css_first/text/iter/traverse API used by the scraper.
+    from .lexbor import LexborHTMLParser as HTMLParser  # type: ignore[assignment]  # noqa: F811
+except ImportError:
+    pass
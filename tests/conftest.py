@@ -0,0 +1,108 @@
+import importlib.util
+import logging
+import sys
+import types
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+# Resolved once here so test modules can import the project without touching sys.path.
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+def pytest_configure(config):
+    """Install stand-ins for third-party modules before any test module is imported."""
+    _install_playwright_stub()
+    _install_dotenv_stub()
+    _install_tenacity_stub()
+    _install_pandas_stub()
+    _install_rich_stub()
+
+
+@pytest.fixture(scope="session")
+def main_mod(tmp_path_factory):
+    """Import the ``main`` entry point on first use rather than at collection time."""
+    # config.py creates its working directories (and main opens app.log) on
+    # import, relative to the current directory unless overridden.
+    runtime = tmp_path_factory.mktemp("runtime")
+    with pytest.MonkeyPatch.context() as mp:
+        for name in ("CACHE_PATH", "INPUT_DIR", "OUTPUT_DIR", "LOG_DIR", "BACKUP_DIR"):
+            mp.setenv(name, str(runtime / name.lower()))
+        import main
+
+    return main
+
+
+def _needs_stub(name):
+    """Stub ``name`` only when it is neither imported nor installed."""
+    return name not in sys.modules and importlib.util.find_spec(name) is None
+
+
+def _install_playwright_stub():
+    if not _needs_stub("playwright"):
+        return
+    playwright_stub = types.ModuleType("playwright")
+    sync_api_stub = types.ModuleType("playwright.sync_api")
+
+    sync_api_stub.Browser = MagicMock()
+    sync_api_stub.BrowserContext = MagicMock()
+    sync_api_stub.Locator = MagicMock()
+    sync_api_stub.Page = MagicMock()
+    sync_api_stub.Playwright = MagicMock()
+    sync_api_stub.TimeoutError = type("TimeoutError", (Exception,), {})
+
+    def _missing_playwright(*_args, **_kwargs):
+        raise RuntimeError("playwright not available in test environment")
+
+    sync_api_stub.sync_playwright = _missing_playwright
+    playwright_stub.sync_api = sync_api_stub
+    sys.modules["playwright"] = playwright_stub
+    sys.modules["playwright.sync_api"] = sync_api_stub
+
+
+def _install_dotenv_stub():
+    if not _needs_stub("dotenv"):
+        return
+    dotenv_stub = types.ModuleType("dotenv")
+    dotenv_stub.load_dotenv = lambda *args, **kwargs: None
+    sys.modules["dotenv"] = dotenv_stub
+
+
+def _install_tenacity_stub():
+    if not _needs_stub("tenacity"):
+        return
+    tenacity_stub = types.ModuleType("tenacity")
+    tenacity_stub.retry = MagicMock(return_value=lambda fn: fn)
+    tenacity_stub.stop_after_attempt = MagicMock()
+    tenacity_stub.wait_exponential = MagicMock()
+    sys.modules["tenacity"] = tenacity_stub
+
+
+def _install_pandas_stub():
+    if not _needs_stub("pandas"):
+        return
+    pandas_stub = types.ModuleType("pandas")
+    pandas_stub.read_csv = lambda *args, **kwargs: None
+    pandas_stub.DataFrame = object
+    sys.modules["pandas"] = pandas_stub
+
+
+def _install_rich_stub():
+    if not _needs_stub("rich"):
+        return
+    rich_stub = types.ModuleType("rich")
+    console_stub = types.ModuleType("rich.console")
+    logging_stub = types.ModuleType("rich.logging")
+
+    console_stub.Console = MagicMock()
+    # configure_logging attaches the handler to the root logger, so hand back a real one.
+    logging_stub.RichHandler = MagicMock(return_value=logging.NullHandler())
+
+    rich_stub.console = console_stub
+    rich_stub.logging = logging_stub
+
+    sys.modules["rich"] = rich_stub
+    sys.modules["rich.console"] = console_stub
+    sys.modules["rich.logging"] = logging_stub
@@ -1,46 +1,20 @@
-import os
-import sys
+import csv
+import email.message
 import types
+import urllib.error
+from collections import namedtuple
 
 import pytest
 
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-
-if "playwright" not in sys.modules:
-    playwright_stub = types.ModuleType("playwright")
-    sync_api_stub = types.ModuleType("playwright.sync_api")
-
-    class _Dummy:
-        def __getattr__(self, _name):
-            return self
-
-    sync_api_stub.Browser = _Dummy
-    sync_api_stub.BrowserContext = _Dummy
-    sync_api_stub.Page = _Dummy
-    sync_api_stub.Playwright = _Dummy
-    sync_api_stub.TimeoutError = type("TimeoutError", (Exception,), {})
-
-    def _missing_playwright(*_args, **_kwargs):
-        raise RuntimeError("playwright not available in test environment")
-
-    sync_api_stub.sync_playwright = _missing_playwright
-    playwright_stub.sync_api = sync_api_stub
-    sys.modules["playwright"] = playwright_stub
-    sys.modules["playwright.sync_api"] = sync_api_stub
-
-if "tenacity" not in sys.modules:
-    tenacity_stub = types.ModuleType("tenacity")
-
-    def _identity_decorator(*_args, **_kwargs):
-        return lambda fn: fn
+from scraper.cache import Cache
+from scraper.montreal_role import AddressQuery, MontrealRoleScraper, parse_input_frame, parse_input_row
+from scraper.rate import RateLimiter
+from scraper.selectors import SELECTORS
 
-    tenacity_stub.retry = _identity_decorator
-    tenacity_stub.stop_after_attempt = lambda *args, **kwargs: None
-    tenacity_stub.wait_exponential = lambda *args, **kwargs: None
-    sys.modules["tenacity"] = tenacity_stub
 
-from scraper.montreal_role import AddressQuery, MontrealRoleScraper
-from scraper.rate import RateLimiter
+Fill = namedtuple("Fill", "selector value")
+# The stub locators resolve on the first candidate, so fills land on element [0].
+SEARCH_FORM = SELECTORS["search_form"]
 
 
 class DummyCache:
@@ -50,6 +24,9 @@ class DummyCache:
     def set(self, *_args, **_kwargs):
         return None
 
+    def set_many(self, *_args, **_kwargs):
+        return None
+
     def close(self):
         return None
 
@@ -63,17 +40,15 @@ class StubLocator:
         self._page.waits.append((self.selector, state))
 
     def fill(self, value):
-        self._page.fills.append((self.selector, value))
+        self._page.fills.append(Fill(self.selector, value))
+        self._page.values_by_selector[self.selector] = value
 
     def clear(self):
         pass
 
     def input_value(self):
         # Return the last filled value for this selector
-        for selector, value in reversed(self._page.fills):
-            if selector == self.selector:
-                return value
-        return ""
+        return self._page.values_by_selector.get(self.selector, "")
 
     def click(self, timeout=None, force=False):
         self._page.clicks.append(self.selector)
@@ -96,14 +71,16 @@ class StubPage:
         self.url = ""
         self.waits = []
         self.fills = []
+        self.values_by_selector = {}
         self.clicks = []
         self.evaluations = []
+        self._locators = {}
 
     def locator(self, selector):
-        locator = self.__dict__.setdefault("_locators", {})
-        if selector not in locator:
-            locator[selector] = StubLocator(self, selector)
-        return locator[selector]
+        locator = self._locators.get(selector)
+        if locator is None:
+            locator = self._locators[selector] = StubLocator(self, selector)
+        return locator
 
     def wait_for_load_state(self, *_args, **_kwargs):
         return None
@@ -118,8 +95,39 @@ class StubPage:
         self.evaluations.append((script, suggestion))
 
 
-@pytest.fixture
-def scraper(monkeypatch):
+class _AuthWallPageStub:
+    """Page for _perform_search tests: navigation is recorded, nothing is rendered."""
+
+    def __init__(self):
+        self.url = "https://montreal.ca/role-evaluation-fonciere/adresse"
+
+    def goto(self, url, wait_until=None, timeout=None):
+        self.url = url
+
+    def reload(self):
+        self.url = "reloaded"
+
+    def wait_for_load_state(self, *_args, **_kwargs):
+        return None
+
+    def locator(self, selector):
+        return types.SimpleNamespace(count=lambda: 0)
+
+
+def patch_scraper(mp, scraper, **attrs):
+    """Apply several attribute overrides to ``scraper`` through one MonkeyPatch."""
+    for name, value in attrs.items():
+        mp.setattr(scraper, name, value)
+
+
+@pytest.fixture(scope="session")
+def bishop_query():
+    # AddressQuery is frozen, so one instance can be shared by every test.
+    return AddressQuery("1463", "Rue Bishop", "1463 Rue Bishop (Montréal)")
+
+
+@pytest.fixture(scope="module")
+def scraper():
     page = StubPage()
     rate = RateLimiter(delay_min=0, delay_max=0)
     scraper = MontrealRoleScraper(
@@ -128,7 +136,9 @@ def scraper(monkeypatch):
         rate_limiter=rate,
         delay_after_actions=False,
     )
-    monkeypatch.setattr(scraper, "_best_street_suggestion", lambda _query: {
+    # The built-in monkeypatch fixture is function-scoped.
+    mp = pytest.MonkeyPatch()
+    mp.setattr(scraper, "_best_street_suggestion", lambda _query: {
         "displayName": "1463 Rue Bishop (Montréal)",
         "streetGeneric": "Rue",
         "streetName": "Bishop",
@@ -136,132 +146,192 @@ def scraper(monkeypatch):
         "boroughNumber": "01",
         "streetNameOfficial": "Rue Bishop",
     })
-    return scraper
+    yield scraper
+    mp.undo()
+    scraper.close()
 
 
-def test_fill_form_uses_devtools_selectors(scraper):
-    query = AddressQuery("1463", "Rue Bishop", "1463 Rue Bishop (Montréal)")
-    result = scraper._fill_form(query)
+@pytest.fixture(autouse=True)
+def _reset_stub_page(request):
+    """Give each test that shares the module-scoped scraper a clean page log."""
+    if "scraper" in request.fixturenames:
+        page = request.getfixturevalue("scraper").page
+        page.waits.clear()
+        page.fills.clear()
+        page.values_by_selector.clear()
+        page.clicks.clear()
+        page.evaluations.clear()
+
+
+def test_fill_form_uses_devtools_selectors(scraper, bishop_query):
+    result = scraper._fill_form(bishop_query)
 
     # _fill_form should return True on success
     assert result is True
 
     page = scraper.page
 
-    # Check that civic number field was filled
-    # The new implementation uses selectors from SELECTORS config
-    assert any("1463" in str(fill) for fill in page.fills), "Civic number should be filled"
+    # Check that civic number field was filled, keyed by the SELECTORS entry _fill_form uses
+    assert page.values_by_selector.get(SEARCH_FORM["civic_number"][0]) == "1463", "Civic number should be filled"
 
     # Check that street name was filled with suggestion displayName
-    assert any("1463 Rue Bishop (Montréal)" in str(fill) for fill in page.fills), "Street name should be filled with suggestion"
+    assert (
+        page.values_by_selector.get(SEARCH_FORM["street_name_combobox"][0]) == "1463 Rue Bishop (Montréal)"
+    ), "Street name should be filled with suggestion"
 
     # Check that submit button was clicked
-    assert len(page.clicks) > 0, "Submit button should be clicked"
+    assert page.clicks, "Submit button should be clicked"
 
     # Hidden fields should be populated (either via evaluations on locators or page.evaluate)
     # The new implementation uses locator.evaluate() instead of page.evaluate()
-    assert len(page.evaluations) > 0, "Hidden fields should be populated"
+    assert page.evaluations, "Hidden fields should be populated"
 
 
-def test_perform_search_escalates_to_login(monkeypatch, caplog):
-    class PageStub:
-        def __init__(self):
-            self.url = "https://montreal.ca/role-evaluation-fonciere/adresse"
+def test_fetch_propagates_network_errors(scraper, monkeypatch, bishop_query):
+    def _raise(_query):
+        raise ConnectionError("network down")
 
-        def goto(self, url, wait_until=None):
-            self.url = url
+    monkeypatch.setattr(scraper, "_perform_search", _raise)
+    with pytest.raises(ConnectionError):
+        scraper.fetch(bishop_query)
 
-        def reload(self):
-            self.url = "reloaded"
 
-        def wait_for_load_state(self, *_args, **_kwargs):
-            return None
+def test_fetch_persists_results_through_the_cache_writer(tmp_path, monkeypatch, bishop_query):
+    with Cache(tmp_path / "c.db") as cache:
+        with MontrealRoleScraper(
+            page=StubPage(),
+            cache=cache,
+            rate_limiter=RateLimiter(delay_min=0, delay_max=0),
+            delay_after_actions=False,
+        ) as scraper:
+            monkeypatch.setattr(scraper, "_perform_search", lambda _query: ("ok", {"owner_names": "Example"}))
+            payload = scraper.fetch(bishop_query)
 
-        def locator(self, selector):
-            return types.SimpleNamespace(count=lambda: 0)
+        # Leaving the block persisted the queued write and stopped the writer
+        assert not scraper._cache_writer.is_alive()
+        assert cache.get(bishop_query.cache_key) == payload
 
-    page = PageStub()
-    scraper = MontrealRoleScraper(
-        page=page,
+        # Once the writer has stopped, results are written inline
+        other = AddressQuery("10", "Rue Sainte-Catherine", "10 Rue Sainte-Catherine")
+        payload = scraper.fetch(other)
+        assert cache.get(other.cache_key) == payload
+
+
+@pytest.fixture(scope="module")
+def auth_scraper():
+    with MontrealRoleScraper(
+        page=_AuthWallPageStub(),
         cache=DummyCache(),
         rate_limiter=RateLimiter(delay_min=0, delay_max=0),
         delay_after_actions=False,
         login_email="user@example.com",
         login_password="secret",
-    )
-    monkeypatch.setattr(scraper, "_fill_form", lambda _query: True)
-    monkeypatch.setattr(scraper, "_select_address", lambda _query: ("ok", {}))
-    monkeypatch.setattr(scraper, "_parse_final_page", lambda: {"owner_names": "Example"})
-    called = {"count": 0}
-
+    ) as scraper:
+        yield scraper
+
+
+@pytest.mark.parametrize(
+    ("select_statuses", "login_walls", "wall_message"),
+    [
+        # Login wall on first navigation, then the search goes through.
+        (["ok"], 1, "Authentication wall detected during navigation"),
+        # No wall on navigation, but address submission bounces to login once.
+        (["auth_required", "ok"], 0, "Authentication wall detected after address submission"),
+    ],
+    ids=["wall-on-navigation", "wall-after-submission"],
+)
+def test_perform_search_recovers_from_auth_wall(
+    auth_scraper, monkeypatch, caplog, select_statuses, login_walls, wall_message
+):
+    scraper = auth_scraper
+    statuses = list(select_statuses)
     on_login_calls = {"count": 0}
+    ensure_calls = {"count": 0}
 
     def on_login():
         on_login_calls["count"] += 1
-        return on_login_calls["count"] == 1
-
-    monkeypatch.setattr(scraper, "_on_login_page", lambda: on_login())
+        return on_login_calls["count"] <= login_walls
 
     def ensure():
-        called["count"] += 1
+        ensure_calls["count"] += 1
         scraper._auto_login_attempted = True
         return True
 
-    monkeypatch.setattr(scraper, "_ensure_authenticated", ensure)
-    caplog.set_level("INFO")
+    patch_scraper(
+        monkeypatch,
+        scraper,
+        _fill_form=lambda _query: True,
+        _select_address=lambda _query: (statuses.pop(0), {}),
+        _parse_final_page=lambda: {"owner_names": "Example"},
+        _on_login_page_fast=on_login,
+        _ensure_authenticated=ensure,
+        _auto_login_attempted=False,
+    )
+    caplog.set_level("INFO", logger="scraper.montreal_role")
+
     status, payload = scraper._perform_search(AddressQuery("1", "Main", "1 Main"))
+
     assert status == "ok"
-    assert called["count"] == 1
+    assert ensure_calls["count"] == 1
     assert payload["owner_names"] == "Example"
-    assert "Authentication wall detected" in caplog.text
+    assert any(wall_message in record.getMessage() for record in caplog.records)
     assert on_login_calls["count"] >= 2
 
 
-def test_perform_search_handles_auth_wall_post_submission(monkeypatch):
-    class PageStub:
-        def __init__(self):
-            self.url = "https://montreal.ca/role-evaluation-fonciere/adresse"
-
-        def goto(self, url, wait_until=None):
-            self.url = url
-
-        def reload(self):
-            self.url = "reloaded"
-
-        def wait_for_load_state(self, *_args, **_kwargs):
-            return None
-
-        def locator(self, selector):
-            return types.SimpleNamespace(count=lambda: 0)
-
-    page = PageStub()
+def test_parse_input_frame_matches_parse_input_row(tmp_path):
+    # The stand-in installed by conftest has no __version__, so this skips
+    # unless the real pandas is available.
+    pytest.importorskip("pandas", minversion="2.0")
+    path = tmp_path / "input.csv"
+    with path.open("w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["civic_number", "streetName", "street_name", "Adresse", "neighborhood", "borough"])
+        writer.writerows(
+            [
+                ["1463", "", "Rue Bishop", "", "Ville-Marie", ""],
+                # Civic number and street recovered from the raw address
+                ["", "", "", "10 Rue Sainte-Catherine", "", "Plateau"],
+                # Only the civic number comes from the raw address
+                ["", "Elm", "", "55A Oak", "", ""],
+                [" 12-B ", "  Main  ", "", "", "  ", "Plateau"],
+                # Civic number without a street, whitespace-only street, unmatched address, blank row
+                ["7", "", "", "7 Pine", "", ""],
+                ["8", " ", "", "", "", ""],
+                ["", "", "", "Unmatched address", "", ""],
+                ["", "", "", "", "", ""],
+            ]
+        )
+
+    with path.open(newline="", encoding="utf-8") as handle:
+        expected = [query for query in map(parse_input_row, csv.DictReader(handle)) if query]
+
+    assert len(expected) == 4
+    assert parse_input_frame(path) == expected
+
+
+def test_street_suggestion_honours_retry_after_without_action_delays(monkeypatch, bishop_query):
     scraper = MontrealRoleScraper(
-        page=page,
+        page=StubPage(),
         cache=DummyCache(),
         rate_limiter=RateLimiter(delay_min=0, delay_max=0),
         delay_after_actions=False,
-        login_email="user@example.com",
-        login_password="secret",
     )
-    monkeypatch.setattr(scraper, "_fill_form", lambda _query: True)
-    statuses = ["auth_required", "ok"]
+    headers = email.message.Message()
+    headers["Retry-After"] = "7"
 
-    def _select(_query):
-        status = statuses.pop(0)
-        return status, {}
+    def _throttled(request):
+        raise urllib.error.HTTPError(request.full_url, 429, "Too Many Requests", headers, None)
 
-    monkeypatch.setattr(scraper, "_select_address", _select)
-    monkeypatch.setattr(scraper, "_parse_final_page", lambda: {"owner_names": "Example"})
-    monkeypatch.setattr(scraper, "_on_login_page", lambda: False)
-    attempts = {"count": 0}
+    sleeps = []
+    monkeypatch.setattr("urllib.request.urlopen", _throttled)
+    monkeypatch.setattr("scraper.rate.time.sleep", sleeps.append)
+    # Call the undecorated method so tenacity's own backoff stays out of the test
+    method = MontrealRoleScraper._best_street_suggestion
+    unwrapped = getattr(method, "__wrapped__", method)
 
-    def ensure():
-        attempts["count"] += 1
-        scraper._auto_login_attempted = True
-        return True
+    with pytest.raises(urllib.error.HTTPError):
+        unwrapped(scraper, bishop_query)
+    scraper.close()
 
-    monkeypatch.setattr(scraper, "_ensure_authenticated", ensure)
-    status, payload = scraper._perform_search(AddressQuery("1", "Main", "1 Main"))
-    assert status == "ok"
-    assert attempts["count"] == 1
-    assert payload["owner_names"] == "Example"
+    assert len(sleeps) == 1
+    assert sleeps[0] >= 7
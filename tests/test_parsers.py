@@ -1,11 +1,15 @@
-import sys
-from pathlib import Path
+import json
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
+import pytest
 
-import json
+import scraper.parsers
+from scraper.parsers import parse_many, parse_result_json, parse_result_page
+from selectolax.parser import PythonHTMLParser
 
-from scraper.parsers import parse_result_json, parse_result_page
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
 
 
 SAMPLE_HTML = """
@@ -136,44 +140,122 @@ SAMPLE_JSON = {
 }
 
 
-def test_parse_result_page_extracts_fields():
-    result = parse_result_page(SAMPLE_HTML)
-    assert result["municipality"] == "Montréal"
-    assert result["fiscal_years"] == "2023-2025"
-    assert result["owner_names"] == "John Doe; Acme Inc"
-    assert result["owner_type"] == "corporation"
-    assert result["matricule"] == "1234-56-7890"
-    assert result["tax_account_number"] == "30 - F26131400"
-    assert result["nb_logements"] == "4"
-    assert result["assessed_terrain_current"] == "12345"
-    assert result["assessed_batiment_current"] == "23456"
-    assert result["assessed_total_current"] == "35801"
-    assert result["assessed_total_previous"] == "30000"
-    distribution = json.loads(result["tax_distribution_json"])
-    assert distribution[0]["subcategory"] == "Résidentiel"
-    assert distribution[0]["percentage"] == "80"
-
-
-def test_parse_result_json_prefers_embedded_html():
-    result = parse_result_json(SAMPLE_JSON)
-    assert result["owner_names"] == "John Doe; Acme Inc"
-    assert result["owner_type"] == "corporation"
-    assert result["matricule"] == "1234-56-7890"
-    assert result["tax_account_number"] == "30 - F26131400"
-    assert result["assessed_total_current"] == "35801"
-    assert result["assessed_total_previous"] == "30000"
-    distribution = json.loads(result["tax_distribution_json"])
-    assert distribution[0]["subcategory"] == "Résidentiel"
-    assert distribution[0]["percentage"] == "80"
-
-
-def test_parse_result_json_falls_back_to_html():
-    payload = {
-        "pageProps": {
-            "content": {
-                "html": SAMPLE_HTML,
-            }
-        }
-    }
-    result = parse_result_json(payload)
-    assert result["owner_names"] == "John Doe; Acme Inc"
+# Production parses with Lexbor whenever the selectolax wheel is installed, so
+# every test runs against both engines. Session scope groups the tests per
+# engine; the memo is cleared so no engine sees the other's parsed rows.
+@pytest.fixture(
+    scope="session",
+    autouse=True,
+    params=[
+        pytest.param(PythonHTMLParser, id="python"),
+        pytest.param(
+            LexborHTMLParser,
+            id="lexbor",
+            marks=pytest.mark.skipif(LexborHTMLParser is None, reason="selectolax wheel not installed"),
+        ),
+    ],
+)
+def engine(request):
+    mp = pytest.MonkeyPatch()
+    mp.setattr(scraper.parsers, "HTMLParser", request.param)
+    scraper.parsers._parse_cache.clear()
+    yield request.param
+    scraper.parsers._parse_cache.clear()
+    mp.undo()
+
+
+# The parsers are pure, so each sample is parsed once per engine and shared read-only.
+@pytest.fixture(scope="session")
+def parsed_html(engine):
+    return parse_result_page(SAMPLE_HTML)
+
+
+@pytest.fixture(scope="session")
+def parsed_json(engine):
+    return parse_result_json(SAMPLE_JSON)
+
+
+@pytest.fixture(scope="session")
+def distribution_html(parsed_html):
+    return json.loads(parsed_html["tax_distribution_json"])
+
+
+@pytest.fixture(scope="session")
+def distribution_json(parsed_json):
+    return json.loads(parsed_json["tax_distribution_json"])
+
+
+@pytest.fixture(scope="session")
+def parsed_json_fallback(engine):
+    return parse_result_json({"pageProps": {"content": {"html": SAMPLE_HTML}}})
+
+
+def test_parse_result_page_extracts_fields(parsed_html, distribution_html):
+    assert parsed_html["municipality"] == "Montréal"
+    assert parsed_html["fiscal_years"] == "2023-2025"
+    assert parsed_html["owner_names"] == "John Doe; Acme Inc"
+    assert parsed_html["owner_type"] == "corporation"
+    assert parsed_html["matricule"] == "1234-56-7890"
+    assert parsed_html["tax_account_number"] == "30 - F26131400"
+    assert parsed_html["nb_logements"] == "4"
+    assert parsed_html["assessed_terrain_current"] == "12345"
+    assert parsed_html["assessed_batiment_current"] == "23456"
+    assert parsed_html["assessed_total_current"] == "35801"
+    assert parsed_html["assessed_total_previous"] == "30000"
+    assert distribution_html[0]["subcategory"] == "Résidentiel"
+    assert distribution_html[0]["percentage"] == "80"
+
+
+def test_parse_result_page_returns_independent_copies_of_cached_rows():
+    first = parse_result_page(SAMPLE_HTML)
+    first["owner_names"] = "mutated"
+    second = parse_result_page(SAMPLE_HTML)
+    assert second["owner_names"] == "John Doe; Acme Inc"
+    assert second is not first
+
+
+def test_parse_result_page_reads_div_grouped_definition_lists():
+    html = SAMPLE_HTML.replace(
+        "<dt>Numéro de matricule</dt><dd>1234-56-7890</dd>",
+        "<div><dt>Numéro de matricule</dt><dd>1234-56-7890</dd></div>",
+    ).replace(
+        "<dt>Nombre de logements</dt><dd>4</dd>",
+        "<div><dt>Nombre de logements</dt><dd>4</dd></div>",
+    )
+    parsed = parse_result_page(html)
+    assert parsed["matricule"] == "1234-56-7890"
+    assert parsed["tax_account_number"] == "30 - F26131400"
+    assert parsed["nb_logements"] == "4"
+
+
+def test_parse_many_matches_sequential_parsing_in_order():
+    other = SAMPLE_HTML.replace("John Doe", "Jane Roe")
+    results = parse_many([SAMPLE_HTML, other, SAMPLE_HTML], max_workers=2)
+    assert [r["owner_names"] for r in results] == [
+        "John Doe; Acme Inc",
+        "Jane Roe; Acme Inc",
+        "John Doe; Acme Inc",
+    ]
+    assert results[0] == parse_result_page(SAMPLE_HTML)
+
+
+def test_parse_result_json_prefers_embedded_html(parsed_json, distribution_json):
+    assert parsed_json["owner_names"] == "John Doe; Acme Inc"
+    assert parsed_json["owner_type"] == "corporation"
+    assert parsed_json["matricule"] == "1234-56-7890"
+    assert parsed_json["tax_account_number"] == "30 - F26131400"
+    assert parsed_json["assessed_total_current"] == "35801"
+    assert parsed_json["assessed_total_previous"] == "30000"
+    assert distribution_json[0]["subcategory"] == "Résidentiel"
+    assert distribution_json[0]["percentage"] == "80"
+
+
+def test_parse_result_json_falls_back_to_html(parsed_json_fallback):
+    assert parsed_json_fallback["owner_names"] == "John Doe; Acme Inc"
+
+
+def test_owner_type_matches_corporate_keywords_as_whole_words():
+    person = parse_result_json({"pageProps": {"owners": ["Vincent Tremblay"], "matricule": "1"}})
+    corporation = parse_result_json({"pageProps": {"owners": ["9123-4567 Québec Inc."], "matricule": "1"}})
+    assert person["owner_type"] == "person"
+    assert corporation["owner_type"] == "corporation"
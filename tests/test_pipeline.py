@@ -1,162 +1,41 @@
-import sys
-import types
-from types import SimpleNamespace
+import csv
 
-if "dotenv" not in sys.modules:
-    dotenv_stub = types.ModuleType("dotenv")
-    dotenv_stub.load_dotenv = lambda *args, **kwargs: None
-    sys.modules["dotenv"] = dotenv_stub
-
-if "pandas" not in sys.modules:
-    pandas_stub = types.ModuleType("pandas")
-    pandas_stub.read_csv = lambda *args, **kwargs: None
-    pandas_stub.DataFrame = object
-    sys.modules["pandas"] = pandas_stub
-
-if "playwright" not in sys.modules:
-    playwright_stub = types.ModuleType("playwright")
-    sync_api_stub = types.ModuleType("playwright.sync_api")
-
-    class _Placeholder:
-        def __getattr__(self, _name):
-            return self
-
-    sync_api_stub.Browser = _Placeholder
-    sync_api_stub.BrowserContext = _Placeholder
-    sync_api_stub.Page = _Placeholder
-    sync_api_stub.Playwright = _Placeholder
-    sync_api_stub.TimeoutError = type("TimeoutError", (Exception,), {})
-
-    def _missing_playwright():
-        raise RuntimeError("playwright not available in test environment")
-
-    sync_api_stub.sync_playwright = _missing_playwright
-
-    playwright_stub.sync_api = sync_api_stub
-    sys.modules["playwright"] = playwright_stub
-    sys.modules["playwright.sync_api"] = sync_api_stub
-
-if "rich" not in sys.modules:
-    rich_stub = types.ModuleType("rich")
-    console_stub = types.ModuleType("rich.console")
-    logging_stub = types.ModuleType("rich.logging")
-
-    class _Console:
-        def __init__(self, *args, **kwargs):
-            pass
-
-        def log(self, *args, **kwargs):
-            pass
-
-    class _RichHandler:
-        def __init__(self, *args, **kwargs):
-            pass
-
-    console_stub.Console = _Console
-    logging_stub.RichHandler = _RichHandler
-
-    rich_stub.console = console_stub
-    rich_stub.logging = logging_stub
-
-    sys.modules["rich"] = rich_stub
-    sys.modules["rich.console"] = console_stub
-    sys.modules["rich.logging"] = logging_stub
-
-if "tenacity" not in sys.modules:
-    tenacity_stub = types.ModuleType("tenacity")
-
-    def _identity_decorator(*_args, **_kwargs):
-        return lambda func: func
-
-    tenacity_stub.retry = _identity_decorator
-    tenacity_stub.stop_after_attempt = lambda *args, **kwargs: None
-    tenacity_stub.wait_exponential = lambda *args, **kwargs: None
-
-    sys.modules["tenacity"] = tenacity_stub
-
-import main
-from scraper.schema import OUTPUT_COLUMNS
-
-
-class DummyFrame:
-    class _ILoc:
-        def __init__(self, frame: "DummyFrame"):
-            self._frame = frame
-
-        def __getitem__(self, index: int):
-            return SimpleNamespace(to_dict=lambda: self._frame._rows[index].copy())
-
-    class _At:
-        def __init__(self, frame: "DummyFrame"):
-            self._frame = frame
-
-        def __setitem__(self, key, value):
-            index, column = key
-            self._frame._rows[index][column] = value
-
-    def __init__(self, rows):
-        self._rows = rows
-
-    def __len__(self) -> int:
-        return len(self._rows)
-
-    @property
-    def iloc(self):
-        return DummyFrame._ILoc(self)
-
-    @property
-    def at(self):
-        return DummyFrame._At(self)
-
-    def copy(self):
-        return DummyFrame([row.copy() for row in self._rows])
-
-    def to_csv(self, *_args, **_kwargs):
-        return None
-
-    def data(self):
-        return self._rows
+import pytest
 
 
 class DummyScraper:
     def __init__(self, responses):
-        self._responses = responses
+        self._responses = iter(responses)
         self.calls = 0
 
     def fetch(self, query):
-        response = self._responses[self.calls]
         self.calls += 1
-        return response
+        return next(self._responses)
+
 
+def _write_input(path, rows):
+    with path.open("w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["civic_number", "street_name", "postal_code"])
+        writer.writerows(rows)
 
-def _frame_row(civic_number: str, street_name: str, status: str):
-    row = {"civicNumber": civic_number, "streetName": street_name}
-    for column in OUTPUT_COLUMNS:
-        row.setdefault(column, "")
-    row["status"] = status
-    return row
 
+def test_process_csv_skips_failures(tmp_path, main_mod):
+    # The stand-in installed by conftest has no __version__, so this skips
+    # unless the real pandas is available.
+    pytest.importorskip("pandas", minversion="2.0")
+    pytest.importorskip("tqdm")
 
-def test_process_csv_skips_failures(monkeypatch, tmp_path):
-    frame = DummyFrame(
+    input_path = tmp_path / "input.csv"
+    output_path = tmp_path / "out" / "enriched.csv"
+    _write_input(
+        input_path,
         [
-            _frame_row("123", "Main", "old_status"),
-            _frame_row("456", "Elm", "stale"),
-        ]
+            ["123", "Main", "H1A 1A1"],
+            ["456", "Elm", "H2B 2B2"],
+            ["", "", "H3C 3C3"],
+        ],
     )
-
-    written_frames = []
-
-    monkeypatch.setattr(main, "read_csv", lambda path: frame.copy())
-    monkeypatch.setattr(main, "backup_original", lambda path, df: path)
-    monkeypatch.setattr(main, "export_snapshot", lambda df, _: None)
-
-    def _capture_write(path, df):
-        written_frames.append(df.copy())
-        return path
-
-    monkeypatch.setattr(main, "write_csv", _capture_write)
-
     scraper = DummyScraper(
         [
             {"status": "ok", "owner_names": "New Owner"},
@@ -164,37 +43,22 @@ def test_process_csv_skips_failures(monkeypatch, tmp_path):
         ]
     )
 
-    args = SimpleNamespace(from_row=2, max=0)
-    main.process_csv(tmp_path / "input.csv", scraper, args)
-
-    assert written_frames, "process_csv should produce an output frame"
-    result_rows = written_frames[-1].data()
-    assert result_rows[0]["owner_names"] == "New Owner"
-    assert result_rows[0]["status"] == "ok"
-    assert result_rows[1]["status"] == "stale"
-
-
-class StubWorksheet:
-    def __init__(self, rows):
-        self._rows = rows
-        self.updates = []
+    stats = main_mod.process_csv(input_path, output_path, scraper, chunk_size=2)
 
-    def row_values(self, index):
-        return self._rows[index - 1]
+    assert stats == {
+        "total_processed": 3,
+        "success_count": 1,
+        "failure_count": 2,
+        "output_path": str(output_path),
+    }
+    # The row without an address never reaches the scraper
+    assert scraper.calls == 2
 
-    def update(self, range_label, values):
-        self.updates.append((range_label, values))
-
-    def get_all_values(self):
-        return self._rows
-
-
-def _sheet_row(civic_number: str, street_name: str, status: str = ""):
-    row = [civic_number, street_name]
-    defaults = {column: "" for column in OUTPUT_COLUMNS}
-    defaults["status"] = status
-    row.extend(defaults[column] for column in OUTPUT_COLUMNS)
-    return row
-
-
-# Placeholder for future test cases
+    with output_path.open(newline="", encoding="utf-8") as handle:
+        result_rows = list(csv.DictReader(handle))
+    assert [row["civic_number"] for row in result_rows] == ["123", "456", ""]
+    assert result_rows[0]["owner_names"] == "New Owner"
+    assert result_rows[0]["status"] == "success"
+    assert result_rows[1]["owner_names"] == ""
+    assert result_rows[1]["status"] == "not_found"
+    assert result_rows[2]["status"] == "error:missing_address"
@@ -0,0 +1,20 @@
+from scraper.rate import RateLimiter
+
+
+def test_slow_down_is_capped_and_speed_up_returns_to_base():
+    rate = RateLimiter(delay_min=1.0, delay_max=2.0, max_delay=5.0)
+    for _ in range(5):
+        rate.slow_down()
+    assert (rate.delay_min, rate.delay_max) == (5.0, 5.0)
+    for _ in range(20):
+        rate.speed_up()
+    assert (rate.delay_min, rate.delay_max) == (1.0, 2.0)
+
+
+def test_penalize_honours_retry_after():
+    rate = RateLimiter(delay_min=1.0, delay_max=2.0, max_delay=30.0)
+    rate.penalize(10)
+    assert rate.delay_min == 10
+    assert rate.delay_max == 11
+    rate.penalize(3)
+    assert rate.delay_min == 10